@@ -0,0 +1,34 @@
+"""Micro-benchmark of ApplicationState kata tracking from 1k to 100k entries."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gvars import ApplicationState
+
+SIZES = [1_000, 10_000, 100_000]
+LANGUAGES = ["python", "javascript", "c", "rust"]
+
+def bench(size: int) -> None:
+    """Time loading a history of `size` katas, then looking every one of them up."""
+    state = ApplicationState()
+    identities = [(f"Kata {i}", LANGUAGES[i % len(LANGUAGES)]) for i in range(size)]
+
+    start = time.perf_counter()
+    for name, language in identities:
+        state.add_pushed_kata(name, language)
+    load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name, language in identities:
+        state.is_kata_pushed(name, language)
+    lookup = time.perf_counter() - start
+
+    print(f"{size:>8} katas | load {load * 1000:9.2f} ms ({load / size * 1e9:7.1f} ns/kata)"
+          f" | lookup {lookup * 1000:9.2f} ms ({lookup / size * 1e9:7.1f} ns/kata)")
+
+if __name__ == "__main__":
+    for size in SIZES:
+        bench(size)
@@ -0,0 +1,69 @@
+"""Measure commit throughput of each commit strategy on a repository with 10k existing katas."""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from Kata import Kata
+from git_committer import GitCommitter, CommitStrategy
+
+EXISTING_KATAS = 10_000
+NEW_KATAS = 200
+EVERY = 10
+LANGUAGES = ["python", "javascript", "c", "rust"]
+
+def render(kata: Kata, number: int) -> str:
+    """Render a kata the way the exporter does."""
+    return f"# {kata.name} [{kata.level}] #{number}\n\n```{kata.language}\n{kata.code}\n```\n\n"
+
+def make_kata(i: int) -> Kata:
+    """Build a synthetic kata."""
+    return Kata(f"Kata {i}", f"{i % 8 + 1} kyu", LANGUAGES[i % len(LANGUAGES)], f"def solution_{i}(x):\n    return x * {i}\n")
+
+def create_repository() -> str:
+    """Create a git repository holding EXISTING_KATAS committed katas."""
+    repo_path = tempfile.mkdtemp(prefix="ktas-bench-")
+    subprocess.run(['git', 'init', '-q'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.name', 'bench'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.email', 'bench@example.com'], cwd=repo_path, check=True)
+    with open(os.path.join(repo_path, "katas.md"), "w") as f:
+        f.writelines(render(make_kata(i), i) for i in range(EXISTING_KATAS))
+    subprocess.run(['git', 'add', '.'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'commit', '-q', '-m', 'initial'], cwd=repo_path, check=True)
+    return repo_path
+
+def bench(template: str, strategy: str) -> None:
+    """Export NEW_KATAS katas with a strategy and report throughput."""
+    repo_path = tempfile.mkdtemp(prefix="ktas-bench-")
+    shutil.rmtree(repo_path)
+    shutil.copytree(template, repo_path)
+    file_path = os.path.join(repo_path, "katas.md")
+    committer = GitCommitter(repo_path, strategy, EVERY)
+
+    start = time.perf_counter()
+    for i in range(EXISTING_KATAS, EXISTING_KATAS + NEW_KATAS):
+        kata = make_kata(i)
+        with open(file_path, "a") as f:
+            f.write(render(kata, i))
+        committer.record(kata, file_path)
+    committer.commit()
+    elapsed = time.perf_counter() - start
+
+    label = f"{strategy} (N={EVERY})" if strategy == CommitStrategy.EVERY_N else strategy
+    print(f"{label:<16} | {committer.commit_count:>4} commits in {elapsed:7.2f} s"
+          f" | {committer.commit_count / elapsed:8.2f} commits/s | {NEW_KATAS / elapsed:9.2f} katas/s")
+    shutil.rmtree(repo_path)
+
+if __name__ == "__main__":
+    template = create_repository()
+    print(f"backend: {GitCommitter(template).backend.name}")
+    try:
+        for strategy in CommitStrategy.ALL:
+            bench(template, strategy)
+    finally:
+        shutil.rmtree(template)
@@ -0,0 +1,247 @@
+"""End-to-end benchmark of the exporter against a local fake Codewars server.
+
+Each scenario starts the fake server with a history of N solutions, runs
+main.py in headless Chrome against it with a fresh git repository, and
+reports katas/second, time per phase and peak RSS of the Python process
+and of its children (chromedriver and Chrome). The run's own timers and
+counters (METRICS_FILE) are included in the JSON results.
+Results can be written as JSON and compared with a previous run:
+
+    python benchmarks/bench_e2e.py --json after.json --compare before.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import threading
+import subprocess
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARKS_DIR, "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from utils import get_process_tree_rss
+from fake_codewars import start_server
+
+SIZES = [100, 1_000, 10_000]
+
+# A phase ends when the first log line containing its marker is printed.
+# Phases whose marker never shows up (e.g. no browser start with the fake
+# backend) are merged into the next one.
+PHASES = [
+    ("startup", "Browser session started"),
+    ("login", "Getting completed katas"),
+    ("export", "Run completed"),
+]
+
+class RssSampler:
+    """Samples the peak RSS of a process and of its descendants in a background thread."""
+
+    def __init__(self, pid: int, interval: float = 0.1):
+        """
+        Initialize the sampler.
+
+        Args:
+            pid: ID of the sampled process
+            interval: Time between samples, in seconds
+        """
+        self.pid = pid
+        self.interval = interval
+        self.peak_python = 0
+        self.peak_children = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self) -> None:
+        """Sample until stopped or the process is gone."""
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        while not self._stop.is_set():
+            try:
+                with open(f"/proc/{self.pid}/statm", "rb") as f:
+                    python = int(f.read().split()[1]) * page_size
+            except OSError:
+                return
+            tree = get_process_tree_rss(self.pid) or python
+            self.peak_python = max(self.peak_python, python)
+            self.peak_children = max(self.peak_children, tree - python)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> 'RssSampler':
+        """Start sampling."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+def create_repository() -> str:
+    """Create an empty git repository."""
+    repo_path = tempfile.mkdtemp(prefix="ktas-e2e-")
+    subprocess.run(['git', 'init', '-q'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.name', 'bench'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.email', 'bench@example.com'], cwd=repo_path, check=True)
+    return repo_path
+
+def write_env_file(path: str, repo_path: str, base_url: str, items: int, overrides: Dict[str, str]) -> None:
+    """Write the configuration of a benchmark run."""
+    settings = {
+        "MAIL_ADDRESS": "bench@example.com",
+        "PASSWORD": "benchmark-password",
+        "USERNAME": "bench",
+        "LOCAL_REPO_PATH": repo_path,
+        "KATA_FILE_NAME": "katas.md",
+        "PUSH_STEP": "all",
+        "COMMIT_STRATEGY": "per-run",
+        "SESSION_CACHE": "false",
+        "CODEWARS_URL": base_url,
+        "FAKE_SOLUTIONS": str(items),
+        **overrides,
+    }
+    with open(path, "w") as f:
+        f.writelines(f'{key}="{value}"\n' for key, value in settings.items())
+
+def count_exported(repo_path: str) -> int:
+    """Count the katas written to the repository."""
+    count = 0
+    for file_name in os.listdir(repo_path):
+        if file_name.endswith(".md"):
+            with open(os.path.join(repo_path, file_name), "rb") as f:
+                count += sum(1 for line in f if line.startswith(b"# "))
+    return count
+
+def run_scenario(items: int, overrides: Dict[str, str], timeout: float) -> dict:
+    """
+    Export a history of `items` solutions with main.py and measure it.
+
+    Args:
+        items: Number of solutions served by the fake server
+        overrides: Configuration values overriding the benchmark defaults
+        timeout: Maximum duration of the run, in seconds
+
+    Returns:
+        dict: Result of the scenario
+    """
+    server = start_server(items)
+    repo_path = create_repository()
+    env_path = os.path.join(repo_path, ".git", "bench.env")
+    metrics_path = os.path.join(repo_path, ".git", "metrics.json")
+    write_env_file(env_path, repo_path, server.url, items, {"METRICS_FILE": metrics_path, **overrides})
+
+    phases: Dict[str, float] = {}
+    pending = list(PHASES)
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-u", os.path.join(SRC_DIR, "main.py"), "--env-file", env_path],
+        cwd=SRC_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    timer = threading.Timer(timeout, process.kill)
+    timer.start()
+    try:
+        with RssSampler(process.pid) as sampler:
+            phase_start = start
+            for line in process.stdout:
+                for position, (name, marker) in enumerate(pending):
+                    if marker in line:
+                        now = time.perf_counter()
+                        phases[name] = now - phase_start
+                        phase_start = now
+                        del pending[:position + 1]
+                        break
+            process.wait()
+        total = time.perf_counter() - start
+        exported = count_exported(repo_path)
+        run_metrics = {}
+        if os.path.exists(metrics_path):
+            with open(metrics_path) as f:
+                run_metrics = json.load(f)
+    finally:
+        timer.cancel()
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(repo_path)
+
+    export_time = phases.get("export", 0.0)
+    return {
+        "items": items,
+        "exit_code": process.returncode,
+        "exported": exported,
+        "total_s": round(total, 3),
+        "phases_s": {name: round(duration, 3) for name, duration in phases.items()},
+        "katas_per_s": round(exported / export_time, 2) if export_time else None,
+        "peak_python_rss": sampler.peak_python,
+        "peak_browser_rss": sampler.peak_children,
+        "metrics": run_metrics,
+    }
+
+def git_revision() -> Optional[str]:
+    """Get the commit the benchmark runs on."""
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR,
+                            capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+def print_results(results: List[dict], baseline: Optional[dict] = None) -> None:
+    """Print a table of results, with the change against a baseline if given."""
+    previous = {r["items"]: r for r in (baseline or {}).get("results", [])}
+    print(f"{'items':>7} | {'exported':>8} | {'total':>8} | {'startup':>8} | {'login':>8} | {'export':>8}"
+          f" | {'katas/s':>9} | {'python':>9} | {'chrome':>9}")
+    for result in results:
+        phases = result["phases_s"]
+        row = (f"{result['items']:>7} | {result['exported']:>8} | {result['total_s']:>7.2f}s"
+               + "".join(f" | {phases[name]:>7.2f}s" if name in phases else f" | {'-':>8}"
+                         for name, _ in PHASES)
+               + f" | {result['katas_per_s'] or 0:>9.1f}"
+               f" | {result['peak_python_rss'] / 2**20:>6.1f} MB | {result['peak_browser_rss'] / 2**20:>6.1f} MB")
+        if result["exit_code"]:
+            row += f" | exit code {result['exit_code']}"
+        before = previous.get(result["items"])
+        if before and before.get("katas_per_s") and result["katas_per_s"]:
+            change = (result["katas_per_s"] / before["katas_per_s"] - 1) * 100
+            row += f" | {change:+.1f}% katas/s vs {baseline.get('revision')}"
+        print(row)
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="End-to-end benchmark against a local fake Codewars server.")
+    parser.add_argument("--items", type=int, nargs="+", default=SIZES, help="history sizes to run")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="configuration override, e.g. SCRAPE_BACKEND=http (repeatable)")
+    parser.add_argument("--timeout", type=float, default=1800, help="maximum duration of each run, in seconds")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results of a previous run to compare with")
+    args = parser.parse_args()
+
+    overrides = dict(setting.split("=", 1) for setting in args.set)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = []
+    for items in args.items:
+        results.append(run_scenario(items, overrides, args.timeout))
+
+    report = {
+        "revision": git_revision(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "settings": overrides,
+        "results": results,
+    }
+    print_results(results, baseline)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Measure the cold-start import time of each command of the exporter.
+
+Every command is run several times in a fresh interpreter with
+`python -X importtime` on a temporary repository using the fake source, and
+the median time spent importing modules is compared with a budget. Heavy
+third-party packages loaded by the command are listed so a regression (e.g.
+Selenium imported by `status`) is easy to spot. Exits with status 1 when a
+command is over budget:
+
+    python benchmarks/bench_startup.py --budget status=80 --budget export=400
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from typing import List, Set, Tuple
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARKS_DIR, "..", "src")
+
+# Import time budgets in milliseconds
+BUDGETS = {
+    "status": 100.0,
+    "verify": 200.0,
+    "export": 500.0,
+}
+
+HEAVY_PACKAGES = ["selenium", "bs4", "lxml", "requests", "dulwich", "cryptography", "dotenv"]
+
+def create_repository() -> str:
+    """Create an empty git repository."""
+    repo_path = tempfile.mkdtemp(prefix="ktas-startup-")
+    subprocess.run(['git', 'init', '-q'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.name', 'bench'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.email', 'bench@example.com'], cwd=repo_path, check=True)
+    return repo_path
+
+def write_env_file(path: str, repo_path: str) -> None:
+    """Write the configuration of the measured runs."""
+    settings = {
+        "MAIL_ADDRESS": "bench@example.com",
+        "PASSWORD": "benchmark-password",
+        "USERNAME": "bench",
+        "LOCAL_REPO_PATH": repo_path,
+        "KATA_FILE_NAME": "katas.md",
+        "PUSH_STEP": "all",
+        "SCRAPE_BACKEND": "fake",
+        "FAKE_SOLUTIONS": "10",
+        "SESSION_CACHE": "false",
+    }
+    with open(path, "w") as f:
+        f.writelines(f'{key}="{value}"\n' for key, value in settings.items())
+
+def measure(command: str, env_path: str) -> Tuple[float, float, Set[str]]:
+    """
+    Run a command in a fresh interpreter.
+
+    Args:
+        command: Command of main.py
+        env_path: Configuration file of the run
+
+    Returns:
+        Tuple[float, float, Set[str]]: Import time and wall time in milliseconds,
+        and the heavy packages that were imported
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(SRC_DIR, "main.py"), command, "--env-file", env_path],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+    )
+    wall = (time.perf_counter() - start) * 1000
+    if result.returncode:
+        raise RuntimeError(f"'{command}' failed with exit code {result.returncode}:\n{result.stderr[-2000:]}")
+
+    # Lines look like "import time:   self [us] | cumulative | package"
+    imports = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:"):].split("|")
+        imports += int(self_time)
+        packages.add(name.strip().split(".")[0])
+    return imports / 1000, wall, packages & set(HEAVY_PACKAGES)
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Measure the cold-start import time of each command.")
+    parser.add_argument("--commands", nargs="+", default=list(BUDGETS), help="commands to measure")
+    parser.add_argument("--runs", type=int, default=5, help="runs per command, the median is reported")
+    parser.add_argument("--budget", action="append", default=[], metavar="COMMAND=MS",
+                        help="import time budget of a command in milliseconds (repeatable)")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS)
+    for setting in args.budget:
+        command, value = setting.split("=", 1)
+        budgets[command] = float(value)
+
+    repo_path = create_repository()
+    env_path = os.path.join(repo_path, ".git", "bench.env")
+    write_env_file(env_path, repo_path)
+    over_budget: List[str] = []
+    try:
+        print(f"{'command':<8} | {'imports':>9} | {'wall':>9} | {'budget':>9} | heavy packages")
+        for command in args.commands:
+            imports: List[float] = []
+            walls: List[float] = []
+            packages: Set[str] = set()
+            for _ in range(args.runs):
+                import_ms, wall_ms, heavy = measure(command, env_path)
+                imports.append(import_ms)
+                walls.append(wall_ms)
+                packages |= heavy
+
+            import_ms = statistics.median(imports)
+            budget = budgets.get(command)
+            row = (f"{command:<8} | {import_ms:>6.1f} ms | {statistics.median(walls):>6.1f} ms | "
+                   f"{f'{budget:.0f} ms' if budget else '-':>9} | {', '.join(sorted(packages)) or '-'}")
+            if budget and import_ms > budget:
+                over_budget.append(command)
+                row += " | OVER BUDGET"
+            print(row)
+    finally:
+        shutil.rmtree(repo_path)
+
+    if over_budget:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
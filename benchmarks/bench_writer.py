@@ -0,0 +1,121 @@
+"""Profile the export hot path (extraction, rendering, writing, committing) on synthetic solutions."""
+
+import os
+import sys
+import time
+import pstats
+import shutil
+import logging
+import argparse
+import cProfile
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from gvars import app_state
+from web_scraper import iter_katas
+from file_management import FileManager
+from git_committer import GitCommitter, CommitStrategy
+from sources import FakeSource
+from vcs import BACKENDS, get_backend
+from main import save_and_commit_kata
+
+def create_repository() -> str:
+    """Create an empty git repository."""
+    repo_path = tempfile.mkdtemp(prefix="ktas-bench-")
+    subprocess.run(['git', 'init', '-q'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.name', 'bench'], cwd=repo_path, check=True)
+    subprocess.run(['git', 'config', 'user.email', 'bench@example.com'], cwd=repo_path, check=True)
+    return repo_path
+
+def export(source: FakeSource, file_manager: FileManager, committer: GitCommitter) -> dict:
+    """
+    Export every solution of the source, timing each stage.
+
+    Commits run inside save_and_commit_kata with the per-kata and every-n
+    strategies, so the backend's commit calls are timed on their own and
+    subtracted from the write stage.
+    """
+    timings = {"extract": 0.0, "write": 0.0, "commit": 0.0}
+    backend_commit = committer.backend.commit
+
+    def timed_commit(*args) -> None:
+        start = time.perf_counter()
+        try:
+            backend_commit(*args)
+        finally:
+            timings["commit"] += time.perf_counter() - start
+
+    committer.backend.commit = timed_commit
+
+    def write(step, *args) -> None:
+        """Run a step, adding its duration minus its commits to the write stage."""
+        start = time.perf_counter()
+        committed = timings["commit"]
+        step(*args)
+        timings["write"] += time.perf_counter() - start - (timings["commit"] - committed)
+
+    katas = iter_katas(source.iter_solutions())
+    count = 0
+    while True:
+        start = time.perf_counter()
+        kata = next(katas, None)
+        timings["extract"] += time.perf_counter() - start
+        if kata is None:
+            break
+
+        write(save_and_commit_kata, kata, file_manager, committer)
+        count += 1
+
+    write(committer.commit)
+    write(file_manager.close)
+    timings["count"] = count
+    return timings
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--katas", type=int, default=100_000, help="number of synthetic solutions")
+    parser.add_argument("--strategy", choices=CommitStrategy.ALL, default=CommitStrategy.EVERY_N)
+    parser.add_argument("--every", type=int, default=1000, help="katas per commit with every-n")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto", help="version control backend")
+    parser.add_argument("--per-language", action="store_true", help="write one file per language")
+    parser.add_argument("--profile", action="store_true", help="print the 25 most expensive functions")
+    args = parser.parse_args()
+
+    # Per-kata log lines would dominate the measurement
+    logging.getLogger().setLevel(logging.WARNING)
+    app_state.different_file_depending_on_language = args.per_language
+
+    repo_path = create_repository()
+    backend = get_backend(args.backend)
+    file_manager = FileManager(repo_path, "katas.md", backend)
+    file_manager.validate_paths()
+    file_manager.read_katas()
+    committer = GitCommitter(repo_path, args.strategy, args.every, backend, before_commit=file_manager.flush)
+    source = FakeSource(args.katas)
+
+    profiler = cProfile.Profile() if args.profile else None
+    try:
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        timings = export(source, file_manager, committer)
+        if profiler:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(repo_path)
+
+    label = f"{args.strategy} (N={args.every})" if args.strategy == CommitStrategy.EVERY_N else args.strategy
+    print(f"backend: {backend.name} | strategy: {label} | {timings['count']} katas exported")
+    for stage in ("extract", "write", "commit"):
+        print(f"{stage:<8} {timings[stage]:8.2f} s ({timings[stage] / elapsed * 100:5.1f} %)")
+    print(f"{'total':<8} {elapsed:8.2f} s | {committer.commit_count} commits | {timings['count'] / elapsed:10.2f} katas/s")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Local stand-in for the Codewars pages used by the exporter.
+
+Serves a sign in form, the account settings page used to check sessions and
+a completed solutions page with a working infinite scroll, over a
+deterministic history of synthetic katas. Any credentials are accepted.
+
+Run it standalone with:
+    python benchmarks/fake_codewars.py --items 1000 --port 8000
+then set CODEWARS_URL=http://127.0.0.1:8000 in the .env file.
+"""
+
+import os
+import sys
+import html
+import secrets
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Set
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from sources.fake_source import generate_solution
+
+PAGE_SIZE = 15
+SESSION_COOKIE = "_session_id"
+
+# Mimics the infinite scroll of Codewars: when the marker comes into view,
+# the next fragment is fetched and its items are inserted before the marker.
+INFINITE_SCROLL_SCRIPT = """
+const list = document.querySelector('.items-list');
+let loading = false;
+const inView = (marker) => marker.getBoundingClientRect().top <= window.innerHeight;
+const load = () => {
+    const marker = document.querySelector('.js-infinite-marker');
+    if (!marker || loading) {
+        return;
+    }
+    loading = true;
+    fetch(marker.dataset.url, {headers: {'X-Requested-With': 'XMLHttpRequest'}})
+        .then((response) => response.text())
+        .then((text) => {
+            const template = document.createElement('template');
+            template.innerHTML = text;
+            for (const item of template.content.querySelectorAll('.list-item-solutions')) {
+                list.insertBefore(item, marker);
+            }
+            const next = template.content.querySelector('.js-infinite-marker');
+            if (next) {
+                marker.dataset.url = next.dataset.url;
+            } else {
+                marker.remove();
+            }
+            loading = false;
+            if (next && inView(marker)) {
+                load();
+            }
+        });
+};
+new IntersectionObserver((entries) => {
+    if (entries.some((entry) => entry.isIntersecting)) {
+        load();
+    }
+}).observe(document.querySelector('.js-infinite-marker'));
+"""
+
+def render_items(start: int, total: int, seed: int = 0) -> str:
+    """Render a page worth of solution items, starting at the given position."""
+    parts = []
+    for index in range(start, min(start + PAGE_SIZE, total)):
+        solution = generate_solution(index, total, seed)
+        parts.append(
+            f'<div class="list-item-solutions" data-id="{index}">'
+            f'<div class="item-title"><span>{solution["level"]}</span>'
+            f'<a href="/kata/{index}">{html.escape(solution["name"])}</a></div>'
+            f'<time-ago datetime="{solution["completed_at"]}"></time-ago>'
+            f'<div class="markdown"><pre><code data-language="{solution["language"]}">'
+            f'{html.escape(solution["code"])}</code></pre></div>'
+            f'</div>'
+        )
+    return "".join(parts)
+
+class FakeCodewarsHandler(BaseHTTPRequestHandler):
+    """Request handler of the fake Codewars server."""
+
+    protocol_version = "HTTP/1.1"
+    # Send headers and body together so keep-alive responses are not delayed by Nagle
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args) -> None:
+        """Keep the benchmark output quiet."""
+
+    def _send(self, status: int, body: str = "", headers: dict = None) -> None:
+        """Send a response with a body."""
+        content = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _redirect(self, location: str, headers: dict = None) -> None:
+        """Redirect to another page."""
+        self._send(302, "", {"Location": location, **(headers or {})})
+
+    def _authenticated(self) -> bool:
+        """Check whether the request carries a valid session cookie."""
+        for cookie in self.headers.get("Cookie", "").split(";"):
+            name, _, value = cookie.strip().partition("=")
+            if name == SESSION_COOKIE and value in self.server.sessions:
+                return True
+        return False
+
+    def do_GET(self) -> None:
+        """Serve pages."""
+        url = urlparse(self.path)
+        if url.path == "/users/sign_in":
+            self._send(200, self.server.sign_in_page())
+        elif not self._authenticated():
+            self._redirect("/users/sign_in")
+        elif url.path == "/users/edit" or url.path == "/dashboard":
+            self._send(200, "<html><body><h1>Dashboard</h1></body></html>")
+        elif url.path.startswith("/users/") and url.path.endswith("/completed_solutions"):
+            page = int(parse_qs(url.query).get("page", ["0"])[0])
+            fragment = self.headers.get("X-Requested-With") == "XMLHttpRequest"
+            self._send(200, self.server.solutions_page(url.path, page, fragment))
+        else:
+            self._send(404, "<html><body>Not found</body></html>")
+
+    def do_POST(self) -> None:
+        """Sign in with any non-empty credentials."""
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if urlparse(self.path).path != "/users/sign_in":
+            self._send(404)
+        elif form.get("user[email]") and form.get("user[password]"):
+            token = secrets.token_hex(16)
+            self.server.sessions.add(token)
+            self._redirect("/dashboard", {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly"})
+        else:
+            self._send(200, self.server.sign_in_page(error=True))
+
+class FakeCodewarsServer(ThreadingHTTPServer):
+    """Fake Codewars server over a synthetic history of completed solutions."""
+
+    daemon_threads = True
+
+    def __init__(self, items: int, port: int = 0, seed: int = 0):
+        """
+        Initialize the server.
+
+        Args:
+            items: Number of completed solutions in the history
+            port: Port to listen on (0 picks a free one)
+            seed: Seed varying the generated history
+        """
+        super().__init__(("127.0.0.1", port), FakeCodewarsHandler)
+        self.items = items
+        self.seed = seed
+        self.sessions: Set[str] = set()
+
+    @property
+    def url(self) -> str:
+        """Get the base URL of the server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def sign_in_page(self, error: bool = False) -> str:
+        """Render the sign in page."""
+        banner = '<div class="flash-msg error">Invalid email or password.</div>' if error else ""
+        return (
+            "<html><body>" + banner +
+            '<form method="post" action="/users/sign_in">'
+            '<input id="user_email" name="user[email]" type="email">'
+            '<input id="user_password" name="user[password]" type="password">'
+            '<button type="submit">Sign in</button>'
+            "</form></body></html>"
+        )
+
+    def solutions_page(self, path: str, page: int, fragment: bool) -> str:
+        """Render a completed solutions page, or the fragment of a later page."""
+        start = page * PAGE_SIZE
+        items = render_items(start, self.items, self.seed)
+        marker = ""
+        if start + PAGE_SIZE < self.items:
+            marker = f'<div class="js-infinite-marker" data-url="{path}?page={page + 1}"></div>'
+        if fragment:
+            return items + marker
+        return (
+            '<html><body><div class="items-list">' + items + marker + "</div>"
+            "<script>" + (INFINITE_SCROLL_SCRIPT if marker else "") + "</script></body></html>"
+        )
+
+def start_server(items: int, port: int = 0, seed: int = 0) -> FakeCodewarsServer:
+    """
+    Start a fake Codewars server in a background thread.
+
+    Args:
+        items: Number of completed solutions in the history
+        port: Port to listen on (0 picks a free one)
+        seed: Seed varying the generated history
+
+    Returns:
+        FakeCodewarsServer: The running server, stopped with shutdown()
+    """
+    server = FakeCodewarsServer(items, port, seed)
+    threading.Thread(target=server.serve_forever, name="fake-codewars", daemon=True).start()
+    return server
+
+def main(argv: List[str] = None) -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve a fake Codewars history.")
+    parser.add_argument("--items", type=int, default=1000, help="number of completed solutions")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--seed", type=int, default=0, help="seed varying the generated history")
+    args = parser.parse_args(argv)
+
+    server = FakeCodewarsServer(args.items, args.port, args.seed)
+    print(f"Serving {args.items} solutions on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
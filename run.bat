@@ -23,6 +23,6 @@ if not exist "%VENV_PYTHON%" (
 )
 
 :: Run the main script
-"%VENV_PYTHON%" "%SCRIPT_DIR%\src\main.py"
+"%VENV_PYTHON%" "%SCRIPT_DIR%\src\main.py" %*
 
 endlocal 
\ No newline at end of file
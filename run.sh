@@ -21,4 +21,9 @@ if [ ! -x "$VENV_PYTHON" ]; then
     exit 1
 fi
 
-"$VENV_PYTHON" "$SCRIPT_DIR/src/main.py"
\ No newline at end of file
+# Profile the run without changing its arguments, e.g. KTAS_PROFILE=sampling from cron
+if [ -n "$KTAS_PROFILE" ]; then
+    set -- --profile "$KTAS_PROFILE" ${KTAS_PROFILE_OUT:+--profile-out "$KTAS_PROFILE_OUT"} "$@"
+fi
+
+"$VENV_PYTHON" "$SCRIPT_DIR/src/main.py" "$@"
\ No newline at end of file
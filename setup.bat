@@ -13,7 +13,7 @@ if not exist "%SCRIPT_DIR%\venv" (
 
 :: Install dependencies
 echo Installing dependencies...
-call "%SCRIPT_DIR%\venv\Scripts\pip" install -U selenium python-dotenv bs4
+call "%SCRIPT_DIR%\venv\Scripts\pip" install -U selenium python-dotenv bs4 requests dulwich cryptography
 
 :: Ask for alias creation
 echo.
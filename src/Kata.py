@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import Optional
+
 class Kata:
     """
     Represents a Codewars kata solution.
@@ -7,9 +10,11 @@ class Kata:
         level (str): The difficulty level of the kata (e.g. '6 kyu')
         language (str): The programming language used
         code (str): The solution code
+        completed_at (Optional[datetime]): When the kata was completed, if known
     """
     
-    def __init__(self, name: str, level: str, language: str, code: str) -> None:
+    def __init__(self, name: str, level: str, language: str, code: str,
+                 completed_at: Optional[datetime] = None) -> None:
         """
         Initialize a new Kata instance.
         
@@ -18,11 +23,25 @@ class Kata:
             level: The difficulty level
             language: The programming language used
             code: The solution code
+            completed_at: When the kata was completed (optional)
         """
         self.name = name
         self.level = level
         self.language = language
         self.code = code
+        self.completed_at = completed_at
+    
+    def to_markdown(self, number: int) -> str:
+        """
+        Render the kata as an exported markdown entry.
+        
+        Args:
+            number: Sequence number of the kata in the export
+            
+        Returns:
+            str: The markdown entry
+        """
+        return f"# {self.name} [{self.level}] #{number}\n\n```{self.language}\n{self.code}\n```\n\n"
     
     def __str__(self) -> str:
         """Return a string representation of the Kata."""
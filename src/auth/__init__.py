@@ -1,13 +1,22 @@
 from .credentials import Credentials
-from .validator import CredentialsValidator
 from .security import SensitiveDataMasker
+from .session import SessionStore
 from .exceptions import AuthenticationError, ConfigurationError, ValidationError
 
 __all__ = [
     'Credentials',
     'CredentialsValidator',
+    'AuthenticationMetrics',
     'SensitiveDataMasker',
+    'SessionStore',
     'AuthenticationError',
     'ConfigurationError',
     'ValidationError'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name: str):
+    """Import the Selenium based validator on first use."""
+    if name in ('CredentialsValidator', 'AuthenticationMetrics'):
+        from . import validator
+        return getattr(validator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
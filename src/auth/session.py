@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+logger = logging.getLogger(__name__)
+
+def set_browser_cookies(web_driver, cookies: List[Dict[str, Any]]) -> None:
+    """
+    Set cookies in the browser without visiting their domain first.
+
+    Args:
+        web_driver: Selenium WebDriver instance
+        cookies: Selenium cookies, e.g. from get_cookies()
+    """
+    web_driver.execute_cdp_cmd('Network.setCookies', {'cookies': [
+        {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain'),
+            'path': cookie.get('path', '/'),
+            'secure': cookie.get('secure', False),
+            'httpOnly': cookie.get('httpOnly', False),
+            **({'sameSite': cookie['sameSite']} if cookie.get('sameSite') else {}),
+            **({'expires': cookie['expiry']} if cookie.get('expiry') else {})
+        }
+        for cookie in cookies
+    ]})
+
+class SessionStore:
+    """
+    Persists the authenticated browser cookies in an encrypted local file.
+
+    The encryption key is derived from the account password, so the cache
+    cannot be read without it and is invalidated when the password changes.
+    """
+
+    SALT_SIZE = 16
+    KDF_ITERATIONS = 200_000
+
+    def __init__(self, path: str, secret: str, max_age: int = 7 * 24 * 3600):
+        """
+        Initialize the session store.
+
+        Args:
+            path: Path to the encrypted session file
+            secret: Secret the encryption key is derived from
+            max_age: Maximum age of a restored session in seconds
+        """
+        self.path = path
+        self._secret = secret
+        self.max_age = max_age
+
+    @property
+    def available(self) -> bool:
+        """Check whether session encryption is available."""
+        return find_spec('cryptography') is not None
+
+    def _fernet(self, salt: bytes) -> 'Fernet':
+        """Derive the Fernet cipher for a salt."""
+        # Imported on first use so commands that never restore a session do not load it
+        from cryptography.fernet import Fernet
+        key = hashlib.pbkdf2_hmac('sha256', self._secret.encode('utf-8'), salt, self.KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def load_cookies(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load saved cookies if they exist, can be decrypted and have not expired.
+
+        Returns:
+            Optional[List[Dict]]: Selenium cookies, None if no usable session is saved
+        """
+        if not self.available or not os.path.exists(self.path):
+            return None
+
+        from cryptography.fernet import InvalidToken
+        try:
+            with open(self.path, 'rb') as f:
+                content = f.read()
+            salt, token = content[:self.SALT_SIZE], content[self.SALT_SIZE:]
+            data = json.loads(self._fernet(salt).decrypt(token))
+        except (IOError, ValueError, InvalidToken) as e:
+            logger.warning(f"Ignoring unreadable saved session: {type(e).__name__}")
+            return None
+
+        if data.get('expires_at', 0) <= time.time():
+            logger.info("Saved session has expired")
+            return None
+        return data.get('cookies')
+
+    def save(self, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Encrypt and save cookies.
+
+        The directory of the session file must already exist, it is never
+        created here so a mistyped repository path is not created either.
+
+        Args:
+            cookies: Selenium cookies of the authenticated session
+        """
+        if not self.available:
+            logger.info("Install 'cryptography' to reuse the Codewars session between runs")
+            return
+
+        now = time.time()
+        expiries = [cookie['expiry'] for cookie in cookies if cookie.get('expiry')]
+        expires_at = min(max(expiries, default=now + self.max_age), now + self.max_age)
+
+        salt = os.urandom(self.SALT_SIZE)
+        token = self._fernet(salt).encrypt(json.dumps({'expires_at': expires_at, 'cookies': cookies}).encode('utf-8'))
+
+        temp_path = f"{self.path}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(salt + token)
+        os.replace(temp_path, self.path)
+        logger.info("Session saved for next runs")
+
+    def clear(self) -> None:
+        """Delete the saved session."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def restore(self, web_driver, base_url: str) -> bool:
+        """
+        Restore saved cookies into the browser and check the session is still valid.
+
+        Args:
+            web_driver: Selenium WebDriver instance
+            base_url: Base URL of Codewars
+
+        Returns:
+            bool: True if the browser is authenticated with the restored session
+        """
+        cookies = self.load_cookies()
+        if not cookies:
+            return False
+
+        try:
+            set_browser_cookies(web_driver, cookies)
+
+            # An unauthenticated visit of the account settings redirects to the sign in page
+            web_driver.get(f"{base_url}/users/edit")
+        except Exception as e:
+            logger.warning(f"Failed to restore saved session: {str(e)}")
+            return False
+
+        if "sign_in" in web_driver.current_url:
+            logger.info("Saved session is no longer valid")
+            self.clear()
+            return False
+
+        logger.info("Restored saved session, skipping sign in")
+        return True
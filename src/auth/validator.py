@@ -1,27 +1,73 @@
+import time
+import random
 import logging
-from typing import Optional, Tuple
-from selenium.common.exceptions import NoSuchElementException
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 from .credentials import Credentials
 from .exceptions import AuthenticationError, ValidationError
 from .security import SensitiveDataMasker
+from metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class AuthenticationMetrics:
+    """
+    Metrics of an authentication.
+    
+    Attributes:
+        attempts: Number of authentication attempts made
+        attempt_latencies: Duration of each attempt in seconds, from submit to outcome
+        total_time: Total authentication time in seconds, backoff included
+        succeeded: Whether authentication succeeded
+    """
+    
+    attempts: int = 0
+    attempt_latencies: List[float] = field(default_factory=list)
+    total_time: float = 0.0
+    succeeded: bool = False
+
 class CredentialsValidator:
     """Handles validation and authentication of credentials."""
     
-    def __init__(self, web_driver, max_attempts: int = 3, delay: int = 1):
+    # Error banners displayed by the sign in form on failure
+    ERROR_SELECTOR = ".flash-msg.error, .alert-error, #error_explanation, .field_with_errors"
+    
+    def __init__(self, web_driver, max_attempts: int = 3, delay: float = 1, timeout: float = 10,
+                 backoff_factor: float = 2, max_delay: float = 30):
         """
         Initialize validator with web driver and retry settings.
         
         Args:
             web_driver: Selenium WebDriver instance
             max_attempts: Maximum number of authentication attempts
-            delay: Delay between attempts in seconds
+            delay: Base delay between attempts in seconds
+            timeout: Maximum wait for the outcome of an attempt in seconds
+            backoff_factor: Multiplier applied to the delay after each failed attempt
+            max_delay: Maximum delay between attempts in seconds
         """
         self.web_driver = web_driver
         self.max_attempts = max_attempts
         self.delay = delay
+        self.timeout = timeout
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.metrics = AuthenticationMetrics()
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before the next attempt, with exponential backoff and jitter.
+        
+        Args:
+            attempt: Number of the failed attempt (starting at 1)
+            
+        Returns:
+            float: Delay in seconds
+        """
+        base = min(self.max_delay, self.delay * self.backoff_factor ** (attempt - 1))
+        return base * random.uniform(0.5, 1.5)
     
     def authenticate(self, credentials: Credentials) -> bool:
         """
@@ -42,25 +88,36 @@ class CredentialsValidator:
         )
         logger.info(f"Attempting authentication for {masked_email}")
         
-        attempt = 1
-        while attempt <= self.max_attempts:
-            try:
-                if self._try_authentication(credentials):
-                    logger.info("Authentication successful")
-                    return True
-                
-                logger.error(f"Authentication failed: Attempt {attempt}/{self.max_attempts}")
+        start = time.perf_counter()
+        self.metrics = AuthenticationMetrics()
+        try:
+            attempt = 1
+            while attempt <= self.max_attempts:
+                self.metrics.attempts = attempt
+                try:
+                    if self._try_authentication(credentials):
+                        self.metrics.succeeded = True
+                        logger.info("Authentication successful")
+                        return True
+                    
+                    logger.error(f"Authentication failed: Attempt {attempt}/{self.max_attempts}")
+                    
+                except NoSuchElementException as e:
+                    logger.error(f"Element not found: {str(e)}")
+                except Exception as e:
+                    logger.error(f"Unexpected error during authentication: {str(e)}")
                 
-            except NoSuchElementException as e:
-                logger.error(f"Element not found: {str(e)}")
-            except Exception as e:
-                logger.error(f"Unexpected error during authentication: {str(e)}")
-            
-            attempt += 1
-            if attempt <= self.max_attempts:
-                logger.info(f"Waiting {self.delay} seconds before next attempt...")
-                import time
-                time.sleep(self.delay)
+                if attempt < self.max_attempts:
+                    delay = self._backoff_delay(attempt)
+                    logger.info(f"Waiting {delay:.1f} seconds before next attempt...")
+                    time.sleep(delay)
+                attempt += 1
+        finally:
+            self.metrics.total_time = time.perf_counter() - start
+            metrics.observe('auth', self.metrics.total_time)
+            logger.info(
+                f"Authentication took {self.metrics.total_time:.2f}s over {self.metrics.attempts} attempt(s)"
+            )
         
         raise AuthenticationError(f"Authentication failed after {self.max_attempts} attempts")
     
@@ -85,9 +142,29 @@ class CredentialsValidator:
         
         # Find and click submit button
         submit_button = self.web_driver.find_element('xpath', '//button[@type="submit"]')
+        start = time.perf_counter()
         submit_button.click()
         
-        # Wait for redirect and check if successful
-        import time
-        time.sleep(1)  # Small delay to allow redirect
-        return "sign_in" not in self.web_driver.current_url 
\ No newline at end of file
+        # Wait for a redirect, a new page or an error banner, whichever comes first
+        try:
+            WebDriverWait(self.web_driver, self.timeout).until(
+                lambda driver: "sign_in" not in driver.current_url
+                or self._is_stale(submit_button)
+                or driver.find_elements('css selector', self.ERROR_SELECTOR)
+            )
+        except TimeoutException:
+            logger.warning(f"No authentication outcome after {self.timeout}s")
+        finally:
+            self.metrics.attempt_latencies.append(time.perf_counter() - start)
+            metrics.observe('auth_attempt', self.metrics.attempt_latencies[-1])
+        
+        return "sign_in" not in self.web_driver.current_url
+    
+    @staticmethod
+    def _is_stale(element) -> bool:
+        """Check whether an element belongs to a page that was replaced."""
+        try:
+            element.is_enabled()
+            return False
+        except StaleElementReferenceException:
+            return True
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Module importing a full kata history through git fast-import."""
+
+import os
+import logging
+from typing import Dict, List, Tuple
+from Kata import Kata
+from gvars import app_state
+from file_management import FileManager
+from git_committer import kata_commit_message
+from vcs import FastImportSession
+
+logger = logging.getLogger(__name__)
+
+def order_chronologically(katas: List[Kata]) -> List[Kata]:
+    """
+    Order scraped katas from oldest to newest.
+    
+    Args:
+        katas: Katas in page order (newest first)
+        
+    Returns:
+        List[Kata]: Katas sorted by completion date, or reversed page order if dates are missing
+    """
+    ordered = list(reversed(katas))
+    if all(kata.completed_at for kata in ordered):
+        ordered.sort(key=lambda kata: kata.completed_at.timestamp())
+    return ordered
+
+def backfill_katas(katas: List[Kata], file_manager: FileManager) -> int:
+    """
+    Import katas as one commit each through a single git fast-import process.
+    
+    Commits are created oldest first with the completion date as author date,
+    then the kata files are written to the working tree to match the new HEAD.
+    Each commit only carries the file its kata was appended to.
+    
+    Args:
+        katas: Scraped katas in page order (newest first), already marked as pushed
+        file_manager: File manager of the repository
+        
+    Returns:
+        int: Number of imported commits
+    """
+    ordered = order_chronologically(katas)
+    first_number = app_state.pushed_count - len(ordered) + 1
+    contents: Dict[str, bytearray] = {}
+    entries: List[Tuple[str, str]] = []
+    
+    with FastImportSession(file_manager.repo_path) as session:
+        for i, kata in enumerate(ordered):
+            relative_path = os.path.relpath(file_manager.get_target_path(kata.language), file_manager.repo_path)
+            if relative_path not in contents:
+                contents[relative_path] = bytearray()
+                file_path = os.path.join(file_manager.repo_path, relative_path)
+                if os.path.exists(file_path):
+                    with open(file_path, 'rb') as f:
+                        contents[relative_path] += f.read()
+                        
+            entry = kata.to_markdown(first_number + i)
+            contents[relative_path] += entry.encode('utf-8')
+            entries.append((entry, kata.language))
+            # Stream the accumulated file without copying it, the view is
+            # released before the next entry is appended
+            with memoryview(contents[relative_path]) as content:
+                session.commit({relative_path: content}, kata_commit_message(kata), kata.completed_at)
+            
+    for entry, language in entries:
+        file_manager.add_kata(entry, language)
+    file_manager.flush()
+    session.reset_index(list(contents))
+    
+    logger.info(f"Imported {session.commit_count} kata commit(s)")
+    return session.commit_count
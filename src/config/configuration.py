@@ -1,8 +1,10 @@
 import os
 import logging
 from typing import Dict, Optional
-from dotenv import load_dotenv, dotenv_values
 from auth.exceptions import ConfigurationError
+from git_committer import CommitStrategy
+from vcs import BACKENDS
+from sources import SOURCES
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,8 @@ class Configuration:
         if env_file and not os.path.exists(env_file):
             raise ConfigurationError(f"Environment file not found: {env_file}")
         
+        from dotenv import load_dotenv, dotenv_values
+        
         load_dotenv(env_file)
         self._config = dotenv_values(env_file)
         self._validate_configuration()
@@ -100,11 +104,151 @@ class Configuration:
         return self['KATA_FILE_NAME']
     
     @property
-    def push_step(self) -> int:
-        """Get push step with default value."""
-        return int(self.get('PUSH_STEP', '5'))
+    def push_step(self) -> Optional[int]:
+        """Get push step with default value, None when set to 'all'."""
+        value = self.get('PUSH_STEP', '5')
+        if value.lower() == 'all':
+            return None
+        return int(value)
         
     @property
     def different_file_depending_on_language(self) -> bool:
         """Get whether to use different files for each language."""
-        return self.get('DIFFERENT_FILE_DEPENDING_ON_LANGUAGE', 'false').lower() == 'true' 
\ No newline at end of file
+        return self.get('DIFFERENT_FILE_DEPENDING_ON_LANGUAGE', 'false').lower() == 'true' 
+    
+    @property
+    def incremental(self) -> bool:
+        """Get whether scraping stops at the last exported kata."""
+        return self.get('INCREMENTAL', 'false').lower() == 'true'
+    
+    @property
+    def incremental_stop_after(self) -> int:
+        """Get how many consecutive exported katas end an incremental scrape before the last exported kata is known."""
+        return int(self.get('INCREMENTAL_STOP_AFTER', '20'))
+    
+    @property
+    def commit_strategy(self) -> str:
+        """
+        Get the commit strategy (per-kata, per-run or every-n).
+        
+        Raises:
+            ConfigurationError: If the strategy is unknown
+        """
+        strategy = self.get('COMMIT_STRATEGY', CommitStrategy.PER_KATA).lower()
+        if strategy not in CommitStrategy.ALL:
+            raise ConfigurationError(
+                f"Invalid COMMIT_STRATEGY '{strategy}', expected one of: {', '.join(CommitStrategy.ALL)}"
+            )
+        return strategy
+    
+    @property
+    def commit_every(self) -> int:
+        """Get how many katas are grouped per commit with the every-n strategy."""
+        return int(self.get('COMMIT_EVERY', '10'))
+    
+    @property
+    def vcs_backend(self) -> str:
+        """
+        Get the version control backend (auto, dulwich or subprocess).
+        
+        Raises:
+            ConfigurationError: If the backend is unknown
+        """
+        backend = self.get('VCS_BACKEND', 'auto').lower()
+        if backend not in BACKENDS:
+            raise ConfigurationError(
+                f"Invalid VCS_BACKEND '{backend}', expected one of: {', '.join(BACKENDS)}"
+            )
+        return backend
+    
+    @property
+    def pipeline(self) -> bool:
+        """Get whether katas are written and committed while scraping goes on."""
+        return self.get('PIPELINE', 'false').lower() == 'true'
+    
+    @property
+    def pipeline_queue_size(self) -> int:
+        """Get how many scraped katas may wait to be written in pipeline mode."""
+        return int(self.get('PIPELINE_QUEUE_SIZE', '32'))
+    
+    @property
+    def prune_dom(self) -> bool:
+        """Get whether processed solutions are detached from the page while scrolling."""
+        return self.get('PRUNE_DOM', 'true').lower() == 'true'
+    
+    @property
+    def scroll_timeout(self) -> float:
+        """Get the maximum wait for new solutions after each scroll, in seconds."""
+        return float(self.get('SCROLL_TIMEOUT', '10'))
+    
+    @property
+    def lean_browser(self) -> bool:
+        """Get whether the browser blocks images, fonts, stylesheets and trackers."""
+        return self.get('LEAN_BROWSER', 'false').lower() == 'true'
+    
+    @property
+    def session_cache(self) -> bool:
+        """Get whether the authenticated session is saved and reused between runs."""
+        return self.get('SESSION_CACHE', 'true').lower() == 'true'
+    
+    @property
+    def auth_timeout(self) -> float:
+        """Get the maximum wait for the outcome of a sign in attempt, in seconds."""
+        return float(self.get('AUTH_TIMEOUT', '10'))
+    
+    @property
+    def codewars_url(self) -> str:
+        """Get the base URL of Codewars."""
+        return self.get('CODEWARS_URL', 'https://www.codewars.com').rstrip('/')
+    
+    @property
+    def scrape_backend(self) -> str:
+        """
+        Get how completed solutions are listed (selenium, http or fake).
+        
+        Raises:
+            ConfigurationError: If the backend is unknown
+        """
+        backend = self.get('SCRAPE_BACKEND', 'selenium').lower()
+        if backend not in SOURCES:
+            raise ConfigurationError(
+                f"Invalid SCRAPE_BACKEND '{backend}', expected one of: {', '.join(SOURCES)}"
+            )
+        return backend
+    
+    @property
+    def fake_solutions(self) -> int:
+        """Get how many synthetic solutions the fake backend lists."""
+        return int(self.get('FAKE_SOLUTIONS', '1000'))
+    
+    @property
+    def metrics_file(self) -> Optional[str]:
+        """Get the file run metrics are written to (.json for JSON, Prometheus text otherwise)."""
+        return self.get('METRICS_FILE') or None
+    
+    @property
+    def parallel_startup(self) -> bool:
+        """Get whether the browser starts and signs in while local files are checked."""
+        return self.get('PARALLEL_STARTUP', 'true').lower() == 'true'
+    
+    @property
+    def daemon_port(self) -> int:
+        """Get the local port of the export daemon, 0 to never hand exports to it."""
+        return int(self.get('DAEMON_PORT', '0'))
+    
+    @property
+    def daemon_idle_timeout(self) -> float:
+        """Get how many seconds the export daemon waits for a job before exiting (0 to never exit)."""
+        return float(self.get('DAEMON_IDLE_TIMEOUT', '7200'))
+    
+    @property
+    def daemon_max_browser_rss(self) -> Optional[int]:
+        """Get the browser memory in bytes above which the export daemon restarts it (0 to disable)."""
+        megabytes = int(self.get('DAEMON_MAX_BROWSER_RSS_MB', '1024'))
+        return megabytes * 2**20 if megabytes else None
+    
+    @property
+    def scroll_max_browser_rss(self) -> Optional[int]:
+        """Get the Chrome memory in bytes above which it is restarted while scrolling (0 to disable)."""
+        megabytes = int(self.get('SCROLL_MAX_BROWSER_RSS_MB', '0'))
+        return megabytes * 2**20 if megabytes else None
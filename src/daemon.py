@@ -0,0 +1,304 @@
+"""Module keeping an authenticated solution source alive between scheduled exports."""
+
+import os
+import sys
+import json
+import hmac
+import time
+import socket
+import hashlib
+import logging
+import secrets
+from typing import Any, Callable, Dict, Optional, TextIO
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DAEMON_HOST = "127.0.0.1"
+TOKEN_FILE_NAME = "daemon.token"
+
+# Maximum wait for the authentication messages of a connection, in seconds
+HANDSHAKE_TIMEOUT = 5.0
+
+def create_token_file(path: str) -> str:
+    """
+    Write a new random token readable by the current user only.
+
+    Args:
+        path: Path of the token file, in an existing directory
+
+    Returns:
+        str: The token
+    """
+    token = secrets.token_hex(32)
+    temp_path = f"{path}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    os.replace(temp_path, path)
+    return token
+
+def read_token_file(path: str) -> Optional[str]:
+    """
+    Read the token of a running daemon.
+
+    Args:
+        path: Path of the token file
+
+    Returns:
+        Optional[str]: The token, None if no daemon wrote one
+    """
+    try:
+        with open(path) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def prove(token: str, role: str, nonce: str) -> str:
+    """
+    Prove knowledge of the token for a nonce chosen by the other side.
+
+    The token itself never goes over the connection, so a process
+    listening on the port in place of the daemon learns nothing from it.
+
+    Args:
+        token: Token shared through the token file
+        role: 'client' or 'daemon', so a proof cannot be sent back as is
+        nonce: Random nonce of the other side
+
+    Returns:
+        str: Hex digest of the proof
+    """
+    return hmac.new(token.encode('utf-8'), f"{role}:{nonce}".encode('utf-8'), hashlib.sha256).hexdigest()
+
+def submit_job(port: int, token: str, job: Dict[str, Any], connect_timeout: float = 1.0) -> Optional[int]:
+    """
+    Hand a job to a running daemon and relay its log until it finishes.
+
+    The daemon and the client first prove to each other that they know the
+    token, the job is only sent to a daemon that did.
+
+    Args:
+        port: Local port the daemon listens on
+        token: Token read from the daemon's token file
+        job: Options of the job
+        connect_timeout: Maximum wait for the connection, in seconds
+
+    Returns:
+        Optional[int]: Exit code of the job, None if no daemon accepted it
+    """
+    try:
+        connection = socket.create_connection((DAEMON_HOST, port), timeout=connect_timeout)
+    except OSError:
+        return None
+
+    with connection:
+        stream = connection.makefile('rw', encoding='utf-8')
+        try:
+            connection.settimeout(HANDSHAKE_TIMEOUT)
+            nonce = secrets.token_hex(16)
+            stream.write(json.dumps({'nonce': nonce}) + "\n")
+            stream.flush()
+            challenge = json.loads(stream.readline())
+            if not hmac.compare_digest(str(challenge.get('proof', '')), prove(token, 'daemon', nonce)):
+                logger.warning(f"The process listening on port {port} is not the export daemon, exporting locally")
+                return None
+            stream.write(json.dumps({'proof': prove(token, 'client', str(challenge.get('nonce'))), **job}) + "\n")
+            stream.flush()
+        except (OSError, ValueError, AttributeError):
+            logger.warning(f"No export daemon answered on port {port}, exporting locally")
+            return None
+
+        try:
+            # Jobs run as long as the export takes
+            connection.settimeout(None)
+            logger.info(f"Export handed to the daemon on port {port}")
+            for line in stream:
+                message = json.loads(line)
+                if 'log' in message:
+                    sys.stderr.write(message['log'] + "\n")
+                elif 'error' in message:
+                    logger.warning(f"Export daemon refused the job: {message['error']}")
+                    return None
+                elif 'exit_code' in message:
+                    return message['exit_code']
+        except (OSError, ValueError) as e:
+            logger.error(f"Lost the connection to the export daemon: {str(e)}")
+            return 1
+    logger.error("Export daemon closed the connection before the job finished")
+    return 1
+
+class JobLogHandler(logging.Handler):
+    """Forwards log records of a job to the client that submitted it."""
+
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the handler.
+
+        Args:
+            stream: Text stream of the client connection
+        """
+        super().__init__()
+        self.stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Send a formatted record, ignoring a client that went away."""
+        try:
+            self.stream.write(json.dumps({'log': self.format(record)}) + "\n")
+            self.stream.flush()
+        except (OSError, ValueError):
+            pass
+
+class ExportDaemon:
+    """
+    Long-lived process keeping one signed in solution source for scheduled exports.
+
+    Jobs are received on a local port, one at a time, and run against the
+    same browser, so a scheduled export only costs a page refresh instead of
+    a browser start and a sign in. Clients authenticate with a random token
+    the daemon writes to a file only the current user can read. The browser is recycled when it stops
+    responding, after a failed job and when its memory exceeds a threshold.
+    The daemon exits after a period without jobs.
+    """
+
+    def __init__(self, sign_in: Callable[[], None], close: Callable[[], None],
+                 run_job: Callable[[Dict[str, Any]], None], port: int, token_path: str,
+                 idle_timeout: float = 3600, max_browser_rss: Optional[int] = None):
+        """
+        Initialize the daemon.
+
+        Args:
+            sign_in: Starts the source and signs in
+            close: Closes the source and its browser
+            run_job: Runs a job, raising SystemExit with a non-zero code on failure
+            port: Local port to listen on
+            token_path: File the token of this daemon is written to
+            idle_timeout: Seconds without jobs before exiting, 0 to never exit
+            max_browser_rss: Browser memory in bytes above which it is recycled, None to disable
+        """
+        self._sign_in = sign_in
+        self._close = close
+        self._run_job = run_job
+        self.port = port
+        self.token_path = token_path
+        self._token = ""
+        self.idle_timeout = idle_timeout
+        self.max_browser_rss = max_browser_rss
+        self.jobs = 0
+        # Set when the browser must be restarted before the next job
+        self._recycle_reason: Optional[str] = None
+
+    def serve(self) -> None:
+        """Sign in and run jobs until idle for too long or interrupted."""
+        try:
+            # Inside the try so a failed sign in still closes the browser it started
+            self._sign_in()
+            with socket.create_server((DAEMON_HOST, self.port)) as server:
+                # A new token each start, written once the port is ours, so a
+                # token read from a stale file is useless
+                self._token = create_token_file(self.token_path)
+                server.settimeout(self.idle_timeout or None)
+                logger.info(
+                    f"Export daemon listening on {DAEMON_HOST}:{self.port}"
+                    + (f", exiting after {self.idle_timeout:g}s without jobs" if self.idle_timeout else "")
+                )
+                while True:
+                    try:
+                        connection, _ = server.accept()
+                    except socket.timeout:
+                        logger.info(f"No job received for {self.idle_timeout:g}s, stopping the export daemon")
+                        break
+                    with connection:
+                        self._handle(connection)
+        except KeyboardInterrupt:
+            logger.info("Export daemon interrupted")
+        finally:
+            if self._token and os.path.exists(self.token_path):
+                os.remove(self.token_path)
+            self._close()
+
+    def _handle(self, connection: socket.socket) -> None:
+        """Authenticate and run one job."""
+        # A client that stays silent must not block the daemon
+        connection.settimeout(HANDSHAKE_TIMEOUT)
+        stream = connection.makefile('rw', encoding='utf-8')
+        try:
+            hello = json.loads(stream.readline())
+            nonce = secrets.token_hex(16)
+            self._reply(stream, {'nonce': nonce, 'proof': prove(self._token, 'daemon', str(hello.get('nonce')))})
+            request = json.loads(stream.readline())
+            proof = str(request.pop('proof', ''))
+        except (OSError, ValueError, AttributeError):
+            return
+        if not hmac.compare_digest(proof, prove(self._token, 'client', nonce)):
+            logger.warning("Rejected a job with an invalid token")
+            self._reply(stream, {'error': "invalid token"})
+            return
+        connection.settimeout(None)
+
+        handler = JobLogHandler(stream)
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            handler.setFormatter(root_logger.handlers[0].formatter)
+        root_logger.addHandler(handler)
+
+        metrics.reset()
+        start = time.perf_counter()
+        exit_code = 0
+        try:
+            self._ensure_browser()
+            self._run_job(request)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            logger.error(f"Failed to prepare the browser: {str(e)}")
+            exit_code = 1
+        finally:
+            root_logger.removeHandler(handler)
+        self.jobs += 1
+        logger.info(f"Job {self.jobs} finished in {time.perf_counter() - start:.2f}s with exit code {exit_code}")
+
+        self._reply(stream, {'exit_code': exit_code})
+        if exit_code:
+            # The session may have expired or the page may be stuck, start over
+            self._recycle_reason = "last job failed"
+        else:
+            self._check_browser_memory()
+
+    @staticmethod
+    def _reply(stream: TextIO, message: Dict[str, Any]) -> None:
+        """Send a message to the client, ignoring a client that went away."""
+        try:
+            stream.write(json.dumps(message) + "\n")
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def _recycle(self, reason: str) -> None:
+        """Restart the browser and sign in again."""
+        logger.info(f"Recycling the browser: {reason}")
+        self._recycle_reason = reason
+        self._close()
+        self._sign_in()
+        self._recycle_reason = None
+
+    def _ensure_browser(self) -> None:
+        """Recycle the browser before a job if it was flagged or stopped responding."""
+        import utils
+        from gvars import app_state
+
+        if self._recycle_reason:
+            self._recycle(self._recycle_reason)
+        elif app_state.web_driver and not utils.is_browser_alive():
+            self._recycle("browser stopped responding")
+
+    def _check_browser_memory(self) -> None:
+        """Schedule a browser recycle if its memory exceeds the threshold."""
+        import utils
+
+        if not self.max_browser_rss:
+            return
+        rss = utils.get_browser_rss()
+        if rss and rss > self.max_browser_rss:
+            logger.info(f"Browser uses {rss / 2**20:.0f} MB, above {self.max_browser_rss / 2**20:.0f} MB")
+            self._recycle_reason = "memory threshold exceeded"
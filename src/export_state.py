@@ -0,0 +1,91 @@
+"""Module managing export state persisted alongside the kata repository."""
+
+import os
+import json
+import logging
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIR = ".ktasexporter"
+
+def get_sidecar_path(repo_path: str, file_name: str, create: bool = True) -> str:
+    """
+    Get the path of a sidecar file stored inside the repository.
+
+    The sidecar directory ignores its own content so exporter state
+    never ends up in kata commits.
+
+    Args:
+        repo_path: Path to the repository
+        file_name: Name of the sidecar file
+        create: Whether to create the sidecar directory if it is missing
+
+    Returns:
+        str: Path to the sidecar file
+    """
+    directory = os.path.join(repo_path, SIDECAR_DIR)
+    ignore_path = os.path.join(directory, ".gitignore")
+    if create and not os.path.exists(ignore_path):
+        os.makedirs(directory, exist_ok=True)
+        with open(ignore_path, "w") as f:
+            f.write("*\n")
+    return os.path.join(directory, file_name)
+
+class ExportState:
+    """
+    Persists the high-water mark of exported katas.
+
+    The high-water mark is the identity (name, language) of the newest
+    kata known to be exported, used to stop incremental scrapes early.
+    """
+
+    FILE_NAME = "state.json"
+
+    def __init__(self, repo_path: str, create: bool = True):
+        """
+        Initialize export state for a repository.
+
+        Args:
+            repo_path: Path to the repository
+            create: Whether to create the sidecar directory if it is missing
+        """
+        self.path = get_sidecar_path(repo_path, self.FILE_NAME, create)
+        self._high_water_mark: Optional[Tuple[str, str]] = None
+
+    @property
+    def high_water_mark(self) -> Optional[Tuple[str, str]]:
+        """Get the identity of the newest exported kata."""
+        return self._high_water_mark
+
+    @high_water_mark.setter
+    def high_water_mark(self, identity: Optional[Tuple[str, str]]) -> None:
+        """Set the identity of the newest exported kata."""
+        self._high_water_mark = identity
+
+    def load(self) -> None:
+        """Load state from disk, keeping defaults if missing or unreadable."""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (IOError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export state {self.path}: {str(e)}")
+            return
+
+        mark = data.get("high_water_mark")
+        if mark and mark.get("name"):
+            self._high_water_mark = (mark["name"], mark.get("language", ""))
+
+    def save(self) -> None:
+        """Atomically write state to disk."""
+        data = {"high_water_mark": None}
+        if self._high_water_mark:
+            name, language = self._high_water_mark
+            data["high_water_mark"] = {"name": name, "language": language}
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.path)
@@ -1,28 +1,52 @@
 """Module for managing kata file operations."""
 
 import os
-from typing import Set, Dict
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, TextIO
 import logging
 from gvars import app_state
+from kata_index import KataIndex
+from metrics import metrics
+from vcs import VcsBackend
 from path_validator import validate_path, validate_file_path, validate_git_repository, PathValidationError
 
 logger = logging.getLogger(__name__)
 
 class FileManager:
-    """Class responsible for managing kata file operations."""
+    """
+    Class responsible for managing kata file operations.
     
-    def __init__(self, repo_path: str, file_name: str):
+    Katas are buffered in memory and appended with a single writelines call
+    per file on flush, through an LRU-bounded pool of open append handles.
+    Buffers are also flushed once they exceed a size threshold, so a run
+    committing only at its end does not keep every kata in memory.
+    Use it as a context manager so buffered katas are flushed on exit.
+    """
+    
+    def __init__(self, repo_path: str, file_name: str, vcs_backend: Optional[VcsBackend] = None,
+                 max_open_files: int = 16, max_buffered_chars: int = 256 * 1024):
         """
         Initialize the FileManager.
         
         Args:
             repo_path: Path to the repository
             file_name: Name of the kata file
+            vcs_backend: Version control backend used to validate the repository (optional)
+            max_open_files: Maximum number of append handles kept open
+            max_buffered_chars: Size of the buffered katas above which they are flushed
         """
         self.repo_path = repo_path
+        self.vcs_backend = vcs_backend
         self.file_name = file_name
         self.file_path = os.path.join(repo_path, file_name)
         self._language_files: Dict[str, str] = {}
+        self._index: Optional[KataIndex] = None
+        self._max_open_files = max(1, max_open_files)
+        self._handles: "OrderedDict[str, TextIO]" = OrderedDict()
+        self._validated_paths: Set[str] = set()
+        self._buffers: Dict[str, List[str]] = {}
+        self._max_buffered_chars = max_buffered_chars
+        self._buffered_chars = 0
         
     def _get_language_file_path(self, language: str) -> str:
         """
@@ -49,67 +73,162 @@ class FileManager:
         """
         logger.info("Validating paths...")
         validate_path(self.repo_path)
-        validate_git_repository(self.repo_path)
+        validate_git_repository(self.repo_path, self.vcs_backend)
         validate_file_path(self.file_path, create_if_missing=True)
+        self._validated_paths.add(self.file_path)
         logger.info("Path validation completed successfully")
         
-    def add_kata(self, content: str, language: str = None) -> None:
+    def get_target_path(self, language: str = None) -> str:
+        """
+        Get the file a kata is appended to.
+        
+        Args:
+            language: Programming language (optional)
+            
+        Returns:
+            str: Path to the target file
+        """
+        if app_state.different_file_depending_on_language and language:
+            return self._get_language_file_path(language)
+        return self.file_path
+        
+    def add_kata(self, content: str, language: str = None) -> str:
         """
-        Append a kata to the specified file using buffered write.
+        Buffer a kata to be appended to its target file on the next flush.
         
         Args:
             content: Content to write
             language: Programming language (optional)
             
+        Returns:
+            str: Path of the file the kata will be written to
+            
         Raises:
-            IOError: If there is an error writing to the file
+            PathValidationError: If the target file path is invalid
+            IOError: If flushing buffered katas fails
+        """
+        with metrics.timer('file_add_kata'):
+            target_path = self.get_target_path(language)
+            
+            if target_path not in self._validated_paths:
+                validate_file_path(target_path, create_if_missing=True)
+                self._validated_paths.add(target_path)
+                
+            self._buffers.setdefault(target_path, []).append(content)
+            self._buffered_chars += len(content)
+            
+        if self._buffered_chars > self._max_buffered_chars:
+            self.flush()
+        return target_path
+        
+    def _get_handle(self, path: str) -> TextIO:
+        """
+        Get an open append handle for a file, evicting the least recently used one if needed.
+        
+        Args:
+            path: Path to the file
+            
+        Returns:
+            TextIO: Append handle
+        """
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+            
+        if len(self._handles) >= self._max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+            
+        handle = open(path, "a", buffering=8192)
+        self._handles[path] = handle
+        return handle
+        
+    def flush(self) -> None:
         """
-        target_path = (
-            self._get_language_file_path(language)
-            if app_state.different_file_depending_on_language and language
-            else self.file_path
-        )
+        Append every buffered kata to its file.
+        
+        Entries are handed to the operating system before returning,
+        so they survive a crash of the exporter.
         
+        Raises:
+            IOError: If there is an error writing to a file
+        """
+        while self._buffers:
+            target_path, entries = next(iter(self._buffers.items()))
+            try:
+                handle = self._get_handle(target_path)
+                previous = os.fstat(handle.fileno())
+                with metrics.timer('file_write'):
+                    handle.writelines(entries)
+                    handle.flush()
+                if self._index:
+                    with metrics.timer('index_update'):
+                        self._index.record_append(target_path, previous)
+            except IOError as e:
+                logger.error(f"Error writing to file {target_path}: {str(e)}")
+                raise
+            del self._buffers[target_path]
+        self._buffered_chars = 0
+            
+    def close(self) -> None:
+        """Flush buffered katas and release open handles and the index."""
         try:
-            if app_state.different_file_depending_on_language and language:
-                validate_file_path(target_path, create_if_missing=True)
+            self.flush()
+        finally:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+            if self._index:
+                self._index.close()
+                self._index = None
                 
-            with open(target_path, "a", buffering=8192) as f:
-                f.write(content)
-        except IOError as e:
-            logger.error(f"Error writing to file {target_path}: {str(e)}")
-            raise
+    def __enter__(self) -> 'FileManager':
+        """Enter the context manager."""
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush buffered katas and close the file manager."""
+        self.close()
+            
+    def kata_file_names(self) -> List[str]:
+        """
+        Get the names of the kata files in the repository.
+        
+        Returns:
+            List[str]: Names of the files sharing the kata file's extension
+        """
+        _, ext = os.path.splitext(self.file_name)
+        return [file for file in os.listdir(self.repo_path) if file.endswith(ext)]
             
     def read_katas(self) -> None:
         """
-        Read and process all kata files in the repository to populate already_pushed_katas.
-        Uses a set for faster lookups and memory efficiency.
+        Populate already pushed katas from the repository's kata index.
+        
+        Only files whose mtime or size changed since they were last indexed
+        are parsed again.
         
         Raises:
-            FileNotFoundError: If the file does not exist
-            IOError: If there is an error reading the file
+            IOError: If there is an error reading a file
         """
-        kata_set: Set[str] = set()
+        if self._index is None:
+            self._index = KataIndex(self.repo_path)
+            
+        file_names = self.kata_file_names()
         
-        # Get all markdown files in the repository
-        _, ext = os.path.splitext(self.file_name)
-        for file in os.listdir(self.repo_path):
-            if file.endswith(ext):
-                file_path = os.path.join(self.repo_path, file)
-                try:
-                    with open(file_path, 'r', buffering=8192) as f:
-                        for line in f:
-                            if line.startswith('#') and "kyu" in line.lower():
-                                kata_title = line[1:line.rfind('#')].strip().split("[")[0].strip()
-                                kata_set.add(kata_title)
-                                
-                except FileNotFoundError:
-                    if file_path == self.file_path:
-                        logger.warning(f"File {file_path} not found. Creating a new file.")
-                        open(file_path, 'a').close()
-                except IOError as e:
-                    logger.error(f"Error reading file {file_path}: {str(e)}")
-                    raise
-        
-        for kata_name in kata_set:
-            app_state.add_pushed_kata(kata_name)
\ No newline at end of file
+        if not os.path.exists(self.file_path):
+            logger.warning(f"File {self.file_path} not found. Creating a new file.")
+            open(self.file_path, 'a').close()
+            if self.file_name not in file_names:
+                file_names.append(self.file_name)
+        
+        try:
+            reparsed = self._index.refresh(file_names)
+        except IOError as e:
+            logger.error(f"Error reading kata files in {self.repo_path}: {str(e)}")
+            raise
+        if reparsed:
+            logger.info(f"Indexed {reparsed} kata file(s)")
+        
+        for kata_name, language in self._index.entries():
+            app_state.add_pushed_kata(kata_name, language)
@@ -0,0 +1,104 @@
+"""Module committing exported katas to the local repository."""
+
+import os
+import logging
+from typing import Callable, List, Dict, Optional
+from Kata import Kata
+from vcs import VcsBackend, VcsError, get_backend
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+def kata_commit_message(kata: Kata) -> str:
+    """
+    Build the commit message of a single exported kata.
+
+    Args:
+        kata: The exported kata
+
+    Returns:
+        str: The commit message
+    """
+    return f"docs(common): add '{kata.name}' kata"
+
+class CommitStrategy:
+    """Supported commit granularities."""
+
+    PER_KATA = "per-kata"
+    PER_RUN = "per-run"
+    EVERY_N = "every-n"
+
+    ALL = [PER_KATA, PER_RUN, EVERY_N]
+
+class GitCommitter:
+    """
+    Commits exported katas according to a commit strategy.
+
+    Only the files touched by pending katas are staged, instead of the
+    whole working tree.
+    """
+
+    def __init__(self, repo_path: str, strategy: str = CommitStrategy.PER_KATA, every: int = 10,
+                 backend: Optional[VcsBackend] = None, before_commit: Optional[Callable[[], None]] = None):
+        """
+        Initialize the committer.
+
+        Args:
+            repo_path: Path to the repository
+            strategy: One of CommitStrategy.ALL
+            every: Number of katas per commit with the every-n strategy
+            backend: Version control backend (defaults to the best available one)
+            before_commit: Called before each commit, e.g. to flush buffered files
+        """
+        if strategy not in CommitStrategy.ALL:
+            raise ValueError(f"Unknown commit strategy: {strategy}")
+        self.repo_path = repo_path
+        self.backend = backend or get_backend()
+        self.before_commit = before_commit
+        self.strategy = strategy
+        self.every = max(1, every)
+        self._pending: List[Kata] = []
+        self._touched_files: Dict[str, None] = {}
+        self.commit_count = 0
+
+    def record(self, kata: Kata, file_path: str) -> None:
+        """
+        Record an exported kata, committing if the strategy requires it.
+
+        Args:
+            kata: The exported kata
+            file_path: Path of the file the kata was written to
+        """
+        self._pending.append(kata)
+        self._touched_files[os.path.relpath(file_path, self.repo_path)] = None
+
+        if self.strategy == CommitStrategy.PER_KATA:
+            self.commit()
+        elif self.strategy == CommitStrategy.EVERY_N and len(self._pending) >= self.every:
+            self.commit()
+
+    def _build_message(self) -> str:
+        """Build the commit message for pending katas."""
+        if len(self._pending) == 1:
+            return kata_commit_message(self._pending[0])
+        lines = [f"docs(common): add {len(self._pending)} katas", ""]
+        lines.extend(f"- {kata.name} [{kata.level}] ({kata.language})" for kata in self._pending)
+        return "\n".join(lines)
+
+    def commit(self) -> None:
+        """Stage touched files and commit pending katas, if any."""
+        if not self._pending:
+            return
+
+        try:
+            if self.before_commit:
+                self.before_commit()
+            with metrics.timer('git_commit'):
+                self.backend.commit(self.repo_path, list(self._touched_files), self._build_message())
+            self.commit_count += 1
+            metrics.increment('commits')
+        except VcsError as e:
+            logger.error(f"Failed to commit {len(self._pending)} kata(s): {str(e)}")
+        finally:
+            self._pending.clear()
+            self._touched_files.clear()
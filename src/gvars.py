@@ -1,7 +1,9 @@
 """Module managing global application state."""
 
-from typing import List, Optional
-from selenium import webdriver
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 class ApplicationState:
     """
@@ -13,9 +15,11 @@ class ApplicationState:
     
     def __init__(self):
         """Initialize application state."""
-        self._web_driver: Optional[webdriver.Chrome] = None
-        self._completed_katas: List[str] = []
-        self._pushed_katas: List[str] = []
+        self._web_driver: Optional['webdriver.Chrome'] = None
+        # Insertion-ordered dicts keyed by (name, language) for O(1) membership
+        self._completed_katas: Dict[Tuple[str, str], None] = {}
+        self._pushed_katas: Dict[Tuple[str, str], None] = {}
+        self._pushed_names: Dict[str, None] = {}
         self._different_file_depending_on_language: bool = False
     
     @property
@@ -29,38 +33,53 @@ class ApplicationState:
         self._different_file_depending_on_language = value
     
     @property
-    def web_driver(self) -> Optional[webdriver.Chrome]:
+    def web_driver(self) -> Optional['webdriver.Chrome']:
         """Get the current WebDriver instance."""
         return self._web_driver
     
     @web_driver.setter
-    def web_driver(self, driver: webdriver.Chrome) -> None:
+    def web_driver(self, driver: 'webdriver.Chrome') -> None:
         """Set the WebDriver instance."""
         self._web_driver = driver
     
     @property
     def completed_katas(self) -> List[str]:
-        """Get list of completed katas."""
-        return self._completed_katas
+        """Get list of completed kata names."""
+        return [name for name, _ in self._completed_katas]
     
-    def add_completed_kata(self, kata_name: str) -> None:
+    def add_completed_kata(self, kata_name: str, language: str = "") -> None:
         """Add a kata to completed list."""
-        if kata_name not in self._completed_katas:
-            self._completed_katas.append(kata_name)
+        self._completed_katas[(kata_name, language)] = None
     
     @property
     def pushed_katas(self) -> List[str]:
-        """Get list of pushed katas."""
-        return self._pushed_katas
+        """Get list of pushed kata names."""
+        return [name for name, _ in self._pushed_katas]
+    
+    @property
+    def pushed_count(self) -> int:
+        """Get number of pushed katas."""
+        return len(self._pushed_katas)
     
-    def add_pushed_kata(self, kata_name: str) -> None:
+    def add_pushed_kata(self, kata_name: str, language: str = "") -> None:
         """Add a kata to pushed list."""
-        if kata_name not in self._pushed_katas:
-            self._pushed_katas.append(kata_name)
+        self._pushed_katas[(kata_name, language)] = None
+        self._pushed_names[kata_name] = None
     
-    def is_kata_pushed(self, kata_name: str) -> bool:
-        """Check if a kata has been pushed."""
-        return kata_name in self._pushed_katas
+    def is_kata_pushed(self, kata_name: str, language: Optional[str] = None) -> bool:
+        """
+        Check if a kata has been pushed.
+        
+        Args:
+            kata_name: Name of the kata
+            language: Programming language, None to match any language
+            
+        Returns:
+            bool: True if the kata was pushed in that language, or with an unknown language
+        """
+        if language is None:
+            return kata_name in self._pushed_names
+        return (kata_name, language) in self._pushed_katas or (kata_name, "") in self._pushed_katas
     
     def cleanup(self) -> None:
         """Cleanup application state."""
@@ -0,0 +1,247 @@
+"""Module managing the persistent index of exported katas."""
+
+import os
+import sqlite3
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from export_state import get_sidecar_path
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class IndexedKata:
+    """
+    Kata entry found in an exported file.
+
+    Attributes:
+        name: The name of the kata
+        language: The programming language used (empty if unknown)
+        level: The difficulty level of the kata
+        offset: Byte offset of the entry title in the file
+        content_hash: SHA-1 of the entry bytes
+    """
+
+    name: str
+    language: str
+    level: str
+    offset: int
+    content_hash: str
+
+def parse_kata_title(line: str) -> Tuple[str, str]:
+    """
+    Parse a kata title line such as '# Name [6 kyu] #12'.
+
+    Args:
+        line: Title line
+
+    Returns:
+        Tuple[str, str]: Kata name and level
+    """
+    title = line[1:line.rfind('#')].strip()
+    name = title.split("[")[0].strip()
+    level = title[title.find("[") + 1:title.rfind("]")].strip() if "[" in title else ""
+    return name, level
+
+def parse_katas(data: bytes, base_offset: int = 0) -> List[IndexedKata]:
+    """
+    Parse kata entries from exported file content.
+
+    Args:
+        data: Raw file content
+        base_offset: Offset of data within the file
+
+    Returns:
+        List[IndexedKata]: Entries in file order
+    """
+    entries: List[IndexedKata] = []
+    starts: List[int] = []
+    position = 0
+    for raw_line in data.splitlines(keepends=True):
+        if raw_line.startswith(b'#'):
+            line = raw_line.decode('utf-8', errors='replace')
+            if "kyu" in line.lower():
+                name, level = parse_kata_title(line)
+                entries.append(IndexedKata(name, "", level, base_offset + position, ""))
+                starts.append(position)
+        elif raw_line.startswith(b'```') and entries and not entries[-1].language:
+            entries[-1].language = raw_line[3:].decode('utf-8', errors='replace').strip()
+        position += len(raw_line)
+
+    for i, entry in enumerate(entries):
+        end = starts[i + 1] if i + 1 < len(starts) else len(data)
+        entry.content_hash = hashlib.sha1(data[starts[i]:end]).hexdigest()
+    return entries
+
+class KataIndex:
+    """
+    SQLite sidecar index of the katas exported to a repository.
+
+    Each indexed file is stored with its mtime and size so unchanged files
+    are trusted without being read again.
+    """
+
+    FILE_NAME = "index.sqlite"
+    SCHEMA_VERSION = 1
+
+    def __init__(self, repo_path: str, create: bool = True):
+        """
+        Open (or create) the index of a repository.
+
+        Args:
+            repo_path: Path to the repository
+            create: Whether to create a missing index, otherwise it is built in memory
+        """
+        self.repo_path = repo_path
+        self.path = get_sidecar_path(repo_path, self.FILE_NAME, create)
+        if not create and not os.path.exists(self.path):
+            self.path = ":memory:"
+        try:
+            self._connection = self._open()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Rebuilding corrupted kata index {self.path}: {str(e)}")
+            os.remove(self.path)
+            self._connection = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            connection.executescript("""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS katas;
+                CREATE TABLE files (
+                    name TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                );
+                CREATE TABLE katas (
+                    file TEXT NOT NULL,
+                    offset INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    PRIMARY KEY (file, offset)
+                );
+            """)
+            connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.commit()
+        return connection
+
+    def _file_stat(self, file_name: str) -> Optional[Tuple[int, int]]:
+        """Get the indexed (mtime_ns, size) of a file."""
+        row = self._connection.execute(
+            "SELECT mtime_ns, size FROM files WHERE name = ?", (file_name,)
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def _insert(self, file_name: str, entries: List[IndexedKata]) -> None:
+        """Insert entries of a file."""
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO katas VALUES (?, ?, ?, ?, ?, ?)",
+            [(file_name, e.offset, e.name, e.language, e.level, e.content_hash) for e in entries]
+        )
+
+    def _set_file_stat(self, file_name: str, stat: os.stat_result) -> None:
+        """Record the (mtime_ns, size) a file was indexed at."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+            (file_name, stat.st_mtime_ns, stat.st_size)
+        )
+
+    def _forget(self, file_name: str) -> None:
+        """Remove a file and its entries from the index."""
+        self._connection.execute("DELETE FROM katas WHERE file = ?", (file_name,))
+        self._connection.execute("DELETE FROM files WHERE name = ?", (file_name,))
+
+    def refresh(self, file_names: List[str]) -> int:
+        """
+        Revalidate the index against the given files, reparsing stale ones.
+
+        Args:
+            file_names: Names of the kata files currently in the repository
+
+        Returns:
+            int: Number of files that had to be reparsed
+        """
+        reparsed = 0
+        for file_name in file_names:
+            file_path = os.path.join(self.repo_path, file_name)
+            stat = os.stat(file_path)
+            if self._file_stat(file_name) == (stat.st_mtime_ns, stat.st_size):
+                continue
+
+            with open(file_path, 'rb') as f:
+                entries = parse_katas(f.read())
+            self._forget(file_name)
+            self._insert(file_name, entries)
+            self._set_file_stat(file_name, stat)
+            reparsed += 1
+
+        present = set(file_names)
+        for (file_name,) in self._connection.execute("SELECT name FROM files").fetchall():
+            if file_name not in present:
+                self._forget(file_name)
+
+        self._connection.commit()
+        return reparsed
+
+    def record_append(self, file_path: str, previous: Optional[os.stat_result]) -> None:
+        """
+        Index content appended to a file since it had the given stat.
+
+        If the file changed behind the index's back, it is dropped from the
+        index and reparsed on the next refresh.
+
+        Args:
+            file_path: Path to the file that was appended to
+            previous: Stat of the file before the append, None if it did not exist
+        """
+        file_name = os.path.basename(file_path)
+        start = previous.st_size if previous else 0
+
+        if start == 0:
+            self._forget(file_name)
+        elif self._file_stat(file_name) != (previous.st_mtime_ns, previous.st_size):
+            self._forget(file_name)
+            self._connection.commit()
+            return
+
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            f.seek(start)
+            entries = parse_katas(f.read(), start)
+        self._insert(file_name, entries)
+        self._set_file_stat(file_name, stat)
+        self._connection.commit()
+
+    def entries(self) -> List[Tuple[str, str]]:
+        """
+        Get every indexed kata.
+
+        Returns:
+            List[Tuple[str, str]]: (name, language) pairs in file order
+        """
+        return self._connection.execute(
+            "SELECT name, language FROM katas ORDER BY file, offset"
+        ).fetchall()
+
+    def language_counts(self) -> List[Tuple[str, int]]:
+        """
+        Count indexed katas by language.
+
+        Returns:
+            List[Tuple[str, int]]: (language, count) pairs, most frequent first
+        """
+        return self._connection.execute(
+            "SELECT language, COUNT(*) FROM katas GROUP BY language ORDER BY COUNT(*) DESC, language"
+        ).fetchall()
+
+    def close(self) -> None:
+        """Close the index database."""
+        self._connection.close()
@@ -1,17 +1,25 @@
 """Main module for the Codewars kata exporter."""
 
 import os
+import time
+import random
 import logging
-from typing import List
-import utils
+import argparse
+from typing import Callable, Dict, List, Optional
 from file_management import FileManager
+from git_committer import GitCommitter
+from kata_index import KataIndex
 from gvars import app_state
-import web_scraper
+from metrics import metrics
+import profiling
+from export_state import ExportState, get_sidecar_path
 from config import Configuration
-from path_validator import PathValidationError
+from sources import SolutionSource, get_source
+from vcs import get_backend, BackendUnavailableError
+from path_validator import PathValidationError, validate_path, validate_git_repository, validate_file_path
 from auth import (
     Credentials,
-    CredentialsValidator,
+    SessionStore,
     AuthenticationError,
     ValidationError,
     ConfigurationError
@@ -24,49 +32,462 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def save_and_commit_kata(kata, file_manager: FileManager) -> None:
-    """Save a kata to file and commit it."""
-    content = f"# {kata.name} [{kata.level}] #{len(app_state.pushed_katas)}\n\n```{kata.language}\n{kata.code}\n```\n\n"
-    file_manager.add_kata(content, kata.language)
-    os.system(f'cd {file_manager.repo_path} && git add . && git commit -m "docs(common): add \'{kata.name}\' kata" > /dev/null 2>&1')
+# First delay, in seconds, before retrying a failed watched export
+WATCH_RETRY_DELAY = 30
+
+def save_and_commit_kata(kata, file_manager: FileManager, committer: GitCommitter,
+                         number: Optional[int] = None) -> None:
+    """Save a kata to file and commit it according to the commit strategy."""
+    if number is None:
+        number = app_state.pushed_count
+    file_path = file_manager.add_kata(kata.to_markdown(number), kata.language)
+    committer.record(kata, file_path)
+    metrics.increment('katas_exported')
     logger.info(f"Le kata '{kata.name}' a été ajouté")
 
-def main():
-    """Main function to run the kata exporter."""
+def run_cleanup_step(description: str, step: Callable[[], None]) -> None:
+    """
+    Run a cleanup step, logging its failure instead of raising.
+    
+    Args:
+        description: What the step does, e.g. "close kata files"
+        step: The cleanup function
+    """
+    try:
+        step()
+    except Exception as e:
+        logger.error(f"Failed to {description}: {str(e)}")
+
+def sign_in(source: SolutionSource, credentials: Credentials) -> None:
+    """
+    Authenticate to a solution source.
+    
+    Args:
+        source: Source to sign in to
+        credentials: User credentials
+    """
+    with metrics.timer('login'):
+        source.login(credentials)
+
+def create_solution_source(config: Configuration) -> SolutionSource:
+    """Create the solution source selected by SCRAPE_BACKEND."""
+    if config.scrape_backend == 'fake':
+        return get_source('fake', count=config.fake_solutions)
+    
+    session_store = None
+    if config.session_cache:
+        # Paths are not validated yet, the session is only saved once they are
+        session_store = SessionStore(
+            get_sidecar_path(config.local_repo_path, "session.bin", create=False),
+            config.password
+        )
+    return get_source(
+        config.scrape_backend,
+        base_url=config.codewars_url,
+        username=config.username,
+        session_store=session_store,
+        lean=config.lean_browser,
+        auth_timeout=config.auth_timeout,
+        prune_dom=config.prune_dom,
+        scroll_timeout=config.scroll_timeout,
+        max_browser_rss=config.scroll_max_browser_rss
+    )
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export your Codewars kata solutions to a local repository.")
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=list(COMMANDS),
+        default='export',
+        help="export completed solutions (default), show exported kata statistics (status), "
+             "check the configuration and repository (verify) or keep a signed in browser "
+             "for later exports (daemon); status and verify never start the browser"
+    )
+    parser.add_argument(
+        '--backfill',
+        action='store_true',
+        help="export the whole history at once through git fast-import, one commit per kata"
+    )
+    parser.add_argument(
+        '--watch',
+        type=float,
+        metavar='INTERVAL',
+        help="keep running and export new solutions every INTERVAL seconds, reusing the browser and session"
+    )
+    parser.add_argument(
+        '--env-file',
+        metavar='PATH',
+        help="read the configuration from this file instead of .env"
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help="log debug details such as per-batch browser statistics"
+    )
+    parser.add_argument(
+        '--profile',
+        choices=profiling.PROFILERS,
+        help="profile the run with cProfile (deterministic) or a low-overhead stack sampler"
+    )
+    parser.add_argument(
+        '--profile-out',
+        metavar='PATH',
+        help="profile file (default: timestamped file in the current directory); "
+             "'.prof' keeps raw cProfile statistics, '.folded' writes sampled stacks for flame graphs"
+    )
+    parser.add_argument(
+        '--webdriver-timeline',
+        metavar='PATH',
+        help="record the latency of every WebDriver command to a CSV file"
+    )
+    return parser.parse_args(argv)
+
+def show_status(args: argparse.Namespace) -> None:
+    """Log statistics of the katas exported to the repository."""
+    config = Configuration(args.env_file)
+    validate_path(config.local_repo_path, require_write=False)
+    file_names = FileManager(config.local_repo_path, config.kata_file_name).kata_file_names()
+    # Only report: a missing index is built in memory instead of in the repository
+    index = KataIndex(config.local_repo_path, create=False)
     try:
-        # Load configuration and initialize credentials
-        config = Configuration()
+        index.refresh(file_names)
+        counts = index.language_counts()
+    finally:
+        index.close()
+    
+    logger.info(f"Repository: {config.local_repo_path}")
+    logger.info(f"{sum(count for _, count in counts)} kata(s) exported in {len(file_names)} file(s)")
+    for language, count in counts:
+        logger.info(f"  {language or 'unknown language'}: {count}")
+    
+    export_state = ExportState(config.local_repo_path, create=False)
+    export_state.load()
+    if export_state.high_water_mark:
+        name, language = export_state.high_water_mark
+        logger.info(f"Newest exported kata: {name} ({language or 'unknown language'})")
+    
+    session_path = get_sidecar_path(config.local_repo_path, "session.bin", create=False)
+    if os.path.exists(session_path):
+        saved_at = time.strftime('%Y-%m-%d %H:%M', time.localtime(os.path.getmtime(session_path)))
+        logger.info(f"Saved session: {saved_at}")
+    else:
+        logger.info("Saved session: none")
+
+def verify_setup(args: argparse.Namespace) -> None:
+    """Check the configuration, credentials format and repository without changing anything."""
+    config = Configuration(args.env_file)
+    Credentials(
+        email=config.mail_address,
+        password=config.password,
+        username=config.username
+    )
+    # Settings with a fixed set of values raise on invalid ones
+    config.commit_strategy
+    config.scrape_backend
+    vcs_backend = get_backend(config.vcs_backend)
+    
+    validate_path(config.local_repo_path)
+    validate_git_repository(config.local_repo_path, vcs_backend)
+    validate_file_path(os.path.join(config.local_repo_path, config.kata_file_name))
+    logger.info(f"Configuration is valid ({config.scrape_backend} source, {vcs_backend.name} backend)")
+
+def open_file_manager(config: Configuration, vcs_backend) -> FileManager:
+    """
+    Create a file manager for the configured repository and read its exported katas.
+    
+    Args:
+        config: Application configuration
+        vcs_backend: Version control backend
+        
+    Returns:
+        FileManager: File manager to close once done
+    """
+    file_manager = FileManager(config.local_repo_path, config.kata_file_name, vcs_backend)
+    with metrics.timer('validate_paths'):
+        file_manager.validate_paths()
+    with metrics.timer('read_katas'):
+        file_manager.read_katas()
+    return file_manager
+
+def export(args: argparse.Namespace, source: Optional[SolutionSource] = None,
+           file_manager: Optional[FileManager] = None) -> None:
+    """
+    Export completed solutions to the repository.
+    
+    Args:
+        args: Command line arguments
+        source: Signed in source kept open by the caller, None to create one,
+            or to hand the export to a running daemon
+        file_manager: File manager whose katas were already read, kept open by
+            the caller, None to create one
+    """
+    run_start = time.perf_counter()
+    config = Configuration(args.env_file)
+    if source is None and config.daemon_port:
+        from daemon import TOKEN_FILE_NAME, read_token_file, submit_job
+        # Only a running daemon leaves a token, nothing is sent to the port otherwise
+        token = read_token_file(get_sidecar_path(config.local_repo_path, TOKEN_FILE_NAME, create=False))
+        exit_code = submit_job(config.daemon_port, token, {'backfill': args.backfill}) if token else None
+        if exit_code is not None:
+            if exit_code:
+                exit(exit_code)
+            return
+    
+    # Imported here so local-only commands do not load Selenium and BeautifulSoup
+    import utils
+    import web_scraper
+    from backfill import backfill_katas
+    from pipeline import ExportPipeline
+    
+    owns_source = source is None
+    owns_files = file_manager is None
+    committer = None
+    login_task = None
+    metrics_file = None
+    try:
+        # Initialize credentials
         credentials = Credentials(
             email=config.mail_address,
             password=config.password,
             username=config.username
         )
+        metrics_file = config.metrics_file
         
         # Set global configuration
         app_state.different_file_depending_on_language = config.different_file_depending_on_language
         
+        # Start the browser and sign in while local files are checked
+        if owns_source:
+            source = create_solution_source(config)
+            if config.parallel_startup:
+                login_task = utils.BackgroundTask(sign_in, source, credentials, name="login").start()
+            else:
+                sign_in(source, credentials)
+        
         # Initialize file manager and validate paths
-        file_manager = FileManager(config.local_repo_path, config.kata_file_name)
-        file_manager.validate_paths()
-        file_manager.read_katas()
+        vcs_backend = get_backend(config.vcs_backend)
+        if owns_files:
+            file_manager = open_file_manager(config, vcs_backend)
+        committer = GitCommitter(
+            config.local_repo_path,
+            config.commit_strategy,
+            config.commit_every,
+            vcs_backend,
+            before_commit=file_manager.flush
+        )
         
-        # Start browser session and authenticate
-        utils.start_browser_session()
-        app_state.web_driver.get("https://www.codewars.com/users/sign_in")
-        logger.info("Connecting to your Codewars account...")
+        if login_task:
+            with metrics.timer('login_wait'):
+                login_task.join()
+            login_task = None
         
-        validator = CredentialsValidator(app_state.web_driver)
-        validator.authenticate(credentials)
+        # Only save a new session in a validated repository
+        if config.session_cache:
+            get_sidecar_path(config.local_repo_path, "session.bin")
+        source.save_session()
         
-        # Navigate to completed solutions and get katas
-        app_state.web_driver.get(f'https://www.codewars.com/users/{credentials.username}/completed_solutions')
+        # List completed solutions
         logger.info("Getting completed katas...")
+        solutions = metrics.time_to_first('time_to_first_scrape', source.iter_solutions(), run_start)
+        
+        if args.backfill:
+            katas = list(metrics.timed_iterator('scrape', web_scraper.iter_katas(solutions)))
+            with metrics.timer('backfill'):
+                backfill_katas(katas, file_manager)
+            return
+        
+        cursor = None
+        # Watched exports only look for solutions newer than the last exported
+        # one, once a complete pass recorded it
+        if config.incremental or args.watch:
+            export_state = ExportState(config.local_repo_path)
+            export_state.load()
+            cursor = web_scraper.ScrapeCursor(
+                stop_marker=export_state.high_water_mark,
+                stop_after=config.incremental_stop_after if config.incremental else 0
+            )
         
-        katas = web_scraper.get_completed_katas(config.push_step)
-        for kata in katas:
-            save_and_commit_kata(kata, file_manager)
-            
-    except (ConfigurationError, ValidationError) as e:
+        katas = metrics.timed_iterator(
+            'scrape', web_scraper.iter_katas(solutions, config.push_step, cursor)
+        )
+        if config.pipeline:
+            # Write and commit katas in a background thread while scraping goes on
+            with ExportPipeline(
+                lambda kata, number: save_and_commit_kata(kata, file_manager, committer, number),
+                config.pipeline_queue_size
+            ) as pipeline:
+                for kata in katas:
+                    pipeline.put(kata, app_state.pushed_count)
+        else:
+            for kata in katas:
+                save_and_commit_kata(kata, file_manager, committer)
+        committer.commit()
+        
+        if cursor and cursor.exhausted and cursor.newest_seen:
+            export_state.high_water_mark = cursor.newest_seen
+            export_state.save()
+    finally:
+        # Each step runs even if a previous one fails, so the browser is never left running
+        if committer:
+            run_cleanup_step("commit pending katas", committer.commit)
+        if file_manager and owns_files:
+            run_cleanup_step("close kata files", file_manager.close)
+        if login_task:
+            # Let a sign in still in progress finish so its browser is not left running
+            try:
+                login_task.join()
+            except BaseException:
+                pass
+        if owns_source:
+            if source:
+                run_cleanup_step("close the solution source", source.close)
+            if app_state.web_driver:
+                run_cleanup_step("close the browser", app_state.cleanup)
+        run_time = time.perf_counter() - run_start
+        metrics.observe('run', run_time)
+        logger.info(f"Run completed in {run_time:.2f}s")
+        metrics.log_summary()
+        if metrics_file:
+            try:
+                metrics.write(metrics_file)
+            except OSError as e:
+                logger.error(f"Failed to write metrics to {metrics_file}: {str(e)}")
+
+def watch_delay(interval: float, failures: int) -> float:
+    """
+    Get the delay before the next watched export.
+    
+    After failures, the delay grows exponentially from WATCH_RETRY_DELAY up
+    to the interval, with jitter so restarted watchers do not retry in step.
+    
+    Args:
+        interval: Delay between successful exports, in seconds
+        failures: Number of consecutive failed exports
+        
+    Returns:
+        float: Delay in seconds
+    """
+    if not failures:
+        return interval
+    base = min(interval, WATCH_RETRY_DELAY * 2 ** (failures - 1))
+    return base * random.uniform(0.5, 1.5)
+
+def watch(args: argparse.Namespace) -> None:
+    """
+    Export new solutions every interval in a single long-lived process.
+    
+    The browser, the signed in session, the repository's file manager and
+    the pushed katas are kept between exports, and each export stops at the
+    last exported kata. The browser is started again when it stops
+    responding or after a failed export.
+    """
+    import utils
+    
+    config = Configuration(args.env_file)
+    credentials = Credentials(
+        email=config.mail_address,
+        password=config.password,
+        username=config.username
+    )
+    app_state.different_file_depending_on_language = config.different_file_depending_on_language
+    file_manager = open_file_manager(config, get_backend(config.vcs_backend))
+    source = create_solution_source(config)
+    
+    def close_source() -> None:
+        """Close the source and its browser."""
+        source.close()
+        if app_state.web_driver:
+            app_state.cleanup()
+    
+    def export_new_solutions(restart: bool) -> None:
+        """Start the browser and sign in again if needed, then export new solutions."""
+        if restart or (app_state.web_driver and not utils.is_browser_alive()):
+            close_source()
+            sign_in(source, credentials)
+        export(args, source, file_manager)
+    
+    logger.info(f"Watching for new solutions every {args.watch:g}s")
+    failures = 0
+    restart = True
+    try:
+        while True:
+            metrics.reset()
+            try:
+                run_command(export_new_solutions, restart)
+                failures = 0
+            except SystemExit:
+                failures += 1
+            # The session may have expired or the page may be stuck, start over
+            restart = failures > 0
+            delay = watch_delay(args.watch, failures)
+            if failures:
+                logger.warning(f"Export failed {failures} time(s) in a row, retrying in {delay:.0f}s")
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        file_manager.close()
+        close_source()
+
+def run_daemon(args: argparse.Namespace) -> None:
+    """Keep a signed in source open and run the exports handed to it."""
+    from daemon import TOKEN_FILE_NAME, ExportDaemon
+    
+    config = Configuration(args.env_file)
+    credentials = Credentials(
+        email=config.mail_address,
+        password=config.password,
+        username=config.username
+    )
+    if not config.daemon_port:
+        raise ConfigurationError("DAEMON_PORT must be set to run the export daemon")
+    # The token file is written inside the repository, which must be valid first
+    FileManager(config.local_repo_path, config.kata_file_name, get_backend(config.vcs_backend)).validate_paths()
+    token_path = get_sidecar_path(config.local_repo_path, TOKEN_FILE_NAME)
+    source = create_solution_source(config)
+    
+    def close() -> None:
+        """Close the source and its browser."""
+        source.close()
+        if app_state.web_driver:
+            app_state.cleanup()
+    
+    def run_job(job: dict) -> None:
+        """Export with the options of a job."""
+        job_args = argparse.Namespace(**vars(args))
+        job_args.backfill = bool(job.get('backfill'))
+        run_command(export, job_args, source)
+    
+    ExportDaemon(
+        lambda: sign_in(source, credentials),
+        close,
+        run_job,
+        config.daemon_port,
+        token_path,
+        config.daemon_idle_timeout,
+        config.daemon_max_browser_rss
+    ).serve()
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    'export': export,
+    'status': show_status,
+    'verify': verify_setup,
+    'daemon': run_daemon
+}
+
+def run_command(command: Callable[..., None], *args) -> None:
+    """
+    Run a command, logging known errors and exiting with status 1 on failure.
+    
+    Args:
+        command: Command function
+        *args: Arguments of the command
+    """
+    try:
+        command(*args)
+    except (ConfigurationError, ValidationError, BackendUnavailableError) as e:
         logger.error(f"Configuration error: {str(e)}")
         logger.error("Please check your .env file and try again.")
         exit(1)
@@ -81,9 +502,30 @@ def main():
     except Exception as e:
         logger.error(f"An unexpected error occurred: {str(e)}")
         exit(1)
+
+def main(argv: Optional[List[str]] = None):
+    """Main function to run the kata exporter."""
+    args = parse_arguments(argv)
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+        for noisy_logger in ('selenium', 'urllib3'):
+            logging.getLogger(noisy_logger).setLevel(logging.INFO)
+    command = watch if args.watch and args.command == 'export' else COMMANDS[args.command]
+    run_command(command, args)
+
+def run(argv: Optional[List[str]] = None):
+    """Run the kata exporter under the profilers requested on the command line."""
+    args = parse_arguments(argv)
+    timeline = profiling.enable_webdriver_timeline() if args.webdriver_timeline else None
+    try:
+        if args.profile:
+            profiling.profile_call(args.profile, args.profile_out, main, argv)
+        else:
+            main(argv)
     finally:
-        if app_state.web_driver:
-            app_state.cleanup()
+        if timeline:
+            timeline.log_summary()
+            timeline.write(args.webdriver_timeline)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run()
\ No newline at end of file
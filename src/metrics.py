@@ -0,0 +1,253 @@
+"""Module collecting per-phase timings and counters of a run."""
+
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+@dataclass
+class TimerStats:
+    """
+    Aggregated durations of a timed operation.
+
+    Attributes:
+        count: Number of timed calls
+        total: Sum of durations, in seconds
+        max: Longest duration, in seconds
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+class Timer:
+    """Context manager adding its duration to a timer of a Metrics registry."""
+
+    __slots__ = ('_metrics', '_name', '_start')
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        """
+        Initialize the timer.
+
+        Args:
+            metrics: Registry the duration is recorded in
+            name: Name of the timer
+        """
+        self._metrics = metrics
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> 'Timer':
+        """Start timing."""
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Record the elapsed time, even if the block raised."""
+        self._metrics.observe(self._name, time.perf_counter() - self._start)
+
+class Metrics:
+    """
+    Thread-safe registry of timers, counters and peak gauges.
+
+    Timers aggregate durations of repeated operations, counters add up
+    events and gauges keep the highest value seen.
+    """
+
+    PROMETHEUS_PREFIX = "ktasexporter"
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._timers: Dict[str, TimerStats] = {}
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def timer(self, name: str) -> Timer:
+        """
+        Time a block of code.
+
+        Args:
+            name: Name of the timer
+
+        Returns:
+            Timer: Context manager recording the block's duration
+        """
+        return Timer(self, name)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            name: Name of the timer
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            stats = self._timers.get(name)
+            if stats is None:
+                stats = self._timers[name] = TimerStats()
+            stats.count += 1
+            stats.total += seconds
+            stats.max = max(stats.max, seconds)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Name of the counter
+            value: Amount to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_max(self, name: str, value: float) -> None:
+        """
+        Raise a gauge to a value if it is higher than the current one.
+
+        Args:
+            name: Name of the gauge
+            value: Observed value
+        """
+        with self._lock:
+            self._gauges[name] = max(self._gauges.get(name, value), value)
+
+    def timed_iterator(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Time how long each item of an iterable takes to produce.
+
+        Args:
+            name: Name of the timer
+            iterable: Lazily produced items, e.g. a generator
+
+        Yields:
+            Each item of the iterable
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.observe(name, time.perf_counter() - start)
+            yield item
+
+    def time_to_first(self, name: str, iterable: Iterable[T], start: float) -> Iterator[T]:
+        """
+        Record when the first item of an iterable is produced.
+
+        Args:
+            name: Name of the timer
+            iterable: Lazily produced items
+            start: perf_counter() value the delay is measured from
+
+        Yields:
+            Each item of the iterable
+        """
+        iterator = iter(iterable)
+        for item in iterator:
+            delay = time.perf_counter() - start
+            self.observe(name, delay)
+            logger.info(f"First solution received {delay:.2f}s after start")
+            yield item
+            break
+        yield from iterator
+
+    def to_dict(self) -> dict:
+        """
+        Get every metric.
+
+        Returns:
+            dict: Timers, counters and gauges by name
+        """
+        with self._lock:
+            return {
+                'timers': {
+                    name: {'count': stats.count, 'total_s': stats.total, 'max_s': stats.max}
+                    for name, stats in self._timers.items()
+                },
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges)
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics for the node-exporter textfile collector
+        """
+        prefix = self.PROMETHEUS_PREFIX
+        data = self.to_dict()
+        lines = []
+        for name, stats in data['timers'].items():
+            lines.append(f"# TYPE {prefix}_{name}_seconds summary")
+            lines.append(f"{prefix}_{name}_seconds_sum {stats['total_s']:.6f}")
+            lines.append(f"{prefix}_{name}_seconds_count {stats['count']}")
+            lines.append(f"# TYPE {prefix}_{name}_seconds_max gauge")
+            lines.append(f"{prefix}_{name}_seconds_max {stats['max_s']:.6f}")
+        for name, value in data['counters'].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value:g}")
+        for name, value in data['gauges'].items():
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value:g}")
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {time.time():.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Atomically write every metric to a file.
+
+        Files ending with '.json' are written as JSON, any other file in the
+        Prometheus text format, e.g. '.prom' for the node-exporter textfile
+        collector.
+
+        Args:
+            path: Path of the metrics file
+        """
+        if path.endswith('.json'):
+            content = json.dumps(self.to_dict(), indent=2)
+        else:
+            content = self.to_prometheus()
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        logger.info(f"Metrics written to {path}")
+
+    def log_summary(self) -> None:
+        """Log a table of every timer, counter and gauge."""
+        data = self.to_dict()
+        if data['timers']:
+            logger.info(f"{'Timer':<22} {'Count':>7} {'Total (s)':>10} {'Avg (ms)':>10} {'Max (ms)':>10}")
+            for name, stats in sorted(data['timers'].items(), key=lambda item: -item[1]['total_s']):
+                average = stats['total_s'] / stats['count'] * 1000 if stats['count'] else 0.0
+                logger.info(
+                    f"{name:<22} {stats['count']:>7} {stats['total_s']:>10.3f} "
+                    f"{average:>10.2f} {stats['max_s'] * 1000:>10.2f}"
+                )
+        for name, value in sorted({**data['counters'], **data['gauges']}.items()):
+            logger.info(f"{name:<22} {value:>7g}")
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+# Global instance
+metrics = Metrics()
@@ -2,8 +2,8 @@
 
 import os
 import logging
-import subprocess
 from typing import Optional
+from vcs import VcsBackend, VcsError, get_backend
 
 logger = logging.getLogger(__name__)
 
@@ -11,32 +11,25 @@ class PathValidationError(Exception):
     """Exception raised for path validation errors."""
     pass
 
-def validate_git_repository(path: str) -> None:
+def validate_git_repository(path: str, backend: Optional[VcsBackend] = None) -> None:
     """
     Validate if a directory is a Git repository.
     
     Args:
         path: Path to validate
+        backend: Version control backend (defaults to the best available one)
         
     Raises:
         PathValidationError: If path is not a Git repository
     """
     try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--is-inside-work-tree'],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        if result.stdout.strip() != 'true':
+        if not (backend or get_backend()).is_repository(path):
             logger.error(f"Invalid repository: {path} is not a Git repository")
             raise PathValidationError(f"Path is not a Git repository: {path}")
         logger.info("Git repository validation successful")
-    except subprocess.CalledProcessError:
-        logger.error(f"Invalid repository: {path} is not a Git repository")
-        raise PathValidationError(f"Path is not a Git repository: {path}")
-    except Exception as e:
+    except PathValidationError:
+        raise
+    except (VcsError, OSError) as e:
         logger.error(f"Failed to validate Git repository: {e}")
         raise PathValidationError(f"Failed to validate Git repository: {e}")
 
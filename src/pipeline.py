@@ -0,0 +1,131 @@
+"""Module overlapping kata scraping with writing and committing."""
+
+import time
+import queue
+import logging
+import threading
+from typing import Callable, Optional, Tuple
+from Kata import Kata
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+class ExportPipeline:
+    """
+    Bounded producer/consumer pipeline between the scraper and the writer.
+
+    The scraper puts katas as soon as they are extracted while a writer thread
+    renders, appends and commits them. A full queue blocks the scraper, which
+    keeps memory bounded when writing is slower than scraping.
+    """
+
+    _STOP = None
+
+    def __init__(self, write: Callable[[Kata, int], None], queue_size: int = 32):
+        """
+        Initialize the pipeline.
+
+        Args:
+            write: Called from the writer thread with each kata and its export number
+            queue_size: Maximum number of katas waiting to be written
+        """
+        self._write = write
+        self._queue: "queue.Queue[Optional[Tuple[Kata, int]]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._thread = threading.Thread(target=self._run, name="kata-writer", daemon=True)
+        self._error: Optional[BaseException] = None
+        self._started_at = 0.0
+        self._put_wait = 0.0
+        self._write_time = 0.0
+        self.scraped_count = 0
+        self.written_count = 0
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write katas until the stop sentinel is received."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            if self._error:
+                continue
+
+            kata, number = item
+            start = time.perf_counter()
+            try:
+                self._write(kata, number)
+                self.written_count += 1
+            except BaseException as e:
+                logger.error(f"Writer stopped on kata '{kata.name}': {str(e)}")
+                self._error = e
+            finally:
+                self._write_time += time.perf_counter() - start
+
+    def put(self, kata: Kata, number: int) -> None:
+        """
+        Hand a kata to the writer, blocking while the queue is full.
+
+        Args:
+            kata: The scraped kata
+            number: Export number of the kata
+
+        Raises:
+            BaseException: The writer's error, if it failed
+        """
+        if self._error:
+            raise self._error
+
+        start = time.perf_counter()
+        while True:
+            try:
+                self._queue.put((kata, number), timeout=0.5)
+                break
+            except queue.Full:
+                if self._error:
+                    raise self._error
+        self._put_wait += time.perf_counter() - start
+        self.scraped_count += 1
+
+    def finish(self) -> None:
+        """
+        Wait for every queued kata to be written and log per-stage throughput.
+
+        Raises:
+            BaseException: The writer's error, if it failed
+        """
+        scrape_time = time.perf_counter() - self._started_at - self._put_wait
+        metrics.observe('pipeline_blocked', self._put_wait)
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._log_throughput(scrape_time)
+        if self._error:
+            raise self._error
+
+    def _log_throughput(self, scrape_time: float) -> None:
+        """Log throughput of the scraping and writing stages."""
+        elapsed = time.perf_counter() - self._started_at
+
+        def rate(count: int, seconds: float) -> float:
+            return count / seconds if seconds > 0 else 0.0
+
+        logger.info(
+            f"Pipeline: {self.scraped_count} scraped in {scrape_time:.2f}s ({rate(self.scraped_count, scrape_time):.2f} katas/s), "
+            f"{self.written_count} written in {self._write_time:.2f}s ({rate(self.written_count, self._write_time):.2f} katas/s), "
+            f"scraper blocked {self._put_wait:.2f}s, total {elapsed:.2f}s"
+        )
+
+    def __enter__(self) -> 'ExportPipeline':
+        """Start the pipeline."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Drain the pipeline, re-raising the writer's error if nothing else failed."""
+        try:
+            self.finish()
+        except BaseException:
+            if exc_type is None:
+                raise
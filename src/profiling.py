@@ -0,0 +1,241 @@
+"""Module profiling runs of the exporter without code changes."""
+
+import io
+import os
+import sys
+import time
+import logging
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+PROFILERS = ['cprofile', 'sampling']
+
+Frame = Tuple[str, str, int]
+
+def default_output_path(profiler: str) -> str:
+    """
+    Build a timestamped profile file name in the current directory.
+
+    Args:
+        profiler: One of PROFILERS
+
+    Returns:
+        str: Path of the profile file
+    """
+    return f"ktasexporter-{profiler}-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling the call stack of a thread at a fixed interval.
+
+    A background thread records where the profiled thread is, so the
+    overhead does not depend on the number of function calls, and time
+    spent blocked (e.g. waiting for the browser) shows up like CPU time.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Time between samples, in seconds
+            thread_id: Thread to sample (defaults to the calling thread)
+        """
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def _run(self) -> None:
+        """Sample the profiled thread until stopped."""
+        start = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack: List[Frame] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+        self.duration = time.perf_counter() - start
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    @staticmethod
+    def _label(frame: Frame) -> str:
+        """Format a frame as 'function (file:line)'."""
+        name, file_name, line = frame
+        return f"{name} ({os.path.basename(file_name)}:{line})"
+
+    def write(self, path: str, limit: int = 40) -> None:
+        """
+        Write the profile.
+
+        Files ending with '.folded' get collapsed stacks for flame graph
+        tools, any other file a report of the functions with the most
+        samples, inclusive and exclusive of their callees.
+
+        Args:
+            path: Path of the profile file
+            limit: Number of functions listed in each report table
+        """
+        if path.endswith('.folded'):
+            with open(path, 'w') as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{';'.join(self._label(frame) for frame in stack)} {count}\n")
+            return
+
+        total = sum(self.samples.values())
+        inclusive: Counter = Counter()
+        exclusive: Counter = Counter()
+        for stack, count in self.samples.items():
+            for frame in set(stack):
+                inclusive[frame] += count
+            exclusive[stack[-1]] += count
+
+        with open(path, 'w') as f:
+            f.write(f"{total} samples over {self.duration:.2f}s ({self.interval * 1000:g} ms interval)\n")
+            for title, counts in (("Inclusive", inclusive), ("Exclusive", exclusive)):
+                f.write(f"\n{title} samples:\n{'%':>7} {'samples':>8}  function\n")
+                for frame, count in counts.most_common(limit):
+                    f.write(f"{count / total * 100 if total else 0:>6.1f}% {count:>8}  {self._label(frame)}\n")
+
+def profile_call(profiler: str, output_path: Optional[str], func: Callable, *args: Any) -> Any:
+    """
+    Call a function under a profiler and write the profile, even if it raises.
+
+    With cProfile, files ending with '.prof' get the raw statistics (for
+    pstats or snakeviz) and any other file a report sorted by cumulative
+    and internal time.
+
+    Args:
+        profiler: One of PROFILERS
+        output_path: Path of the profile file, None for a timestamped file
+        func: Function to profile
+        *args: Arguments of the function
+
+    Returns:
+        Any: Return value of the function
+    """
+    output_path = output_path or default_output_path(profiler)
+
+    if profiler == 'sampling':
+        sampler = SamplingProfiler()
+        sampler.start()
+        try:
+            return func(*args)
+        finally:
+            sampler.stop()
+            sampler.write(output_path)
+            logger.info(f"Sampling profile written to {output_path}")
+
+    # Imported on first use, pstats alone weighs on the startup of every command
+    import cProfile
+    import pstats
+
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func, *args)
+    finally:
+        if output_path.endswith('.prof'):
+            profile.dump_stats(output_path)
+        else:
+            stream = io.StringIO()
+            stats = pstats.Stats(profile, stream=stream)
+            stats.sort_stats('cumulative').print_stats(60)
+            stats.sort_stats('tottime').print_stats(30)
+            with open(output_path, 'w') as f:
+                f.write(stream.getvalue())
+        logger.info(f"cProfile statistics written to {output_path}")
+
+class WebDriverTimeline:
+    """
+    Timeline of the WebDriver commands sent to the browser.
+
+    Every command is timed from the Python side, so remote call latency
+    can be told apart from Python CPU time.
+    """
+
+    def __init__(self):
+        """Initialize an empty timeline."""
+        self._origin = time.perf_counter()
+        # (start offset in seconds, command, duration in seconds, succeeded)
+        self.records: List[Tuple[float, str, float, bool]] = []
+
+    def attach(self, web_driver) -> None:
+        """
+        Record the commands of a WebDriver by wrapping its execute method.
+
+        Args:
+            web_driver: Selenium WebDriver instance
+        """
+        execute = web_driver.execute
+
+        def timed_execute(driver_command: str, params: Optional[Dict] = None):
+            start = time.perf_counter()
+            succeeded = False
+            try:
+                result = execute(driver_command, params)
+                succeeded = True
+                return result
+            finally:
+                duration = time.perf_counter() - start
+                self.records.append((start - self._origin, driver_command, duration, succeeded))
+                metrics.observe('webdriver_command', duration)
+
+        web_driver.execute = timed_execute
+
+    def write(self, path: str) -> None:
+        """
+        Write the timeline as CSV.
+
+        Args:
+            path: Path of the CSV file
+        """
+        with open(path, 'w') as f:
+            f.write("start_s,command,duration_ms,succeeded\n")
+            for start, command, duration, succeeded in self.records:
+                f.write(f"{start:.6f},{command},{duration * 1000:.3f},{str(succeeded).lower()}\n")
+        logger.info(f"WebDriver timeline of {len(self.records)} command(s) written to {path}")
+
+    def log_summary(self) -> None:
+        """Log the latency of each WebDriver command."""
+        durations: Dict[str, List[float]] = {}
+        for _, command, duration, _ in self.records:
+            durations.setdefault(command, []).append(duration)
+
+        for command, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            values.sort()
+            logger.info(
+                f"WebDriver {command}: {len(values)} call(s), total {sum(values):.2f}s, "
+                f"avg {sum(values) / len(values) * 1000:.1f} ms, "
+                f"p95 {values[int(0.95 * (len(values) - 1))] * 1000:.1f} ms, max {values[-1] * 1000:.1f} ms"
+            )
+
+# Timeline attached to browsers started while it is set
+webdriver_timeline: Optional[WebDriverTimeline] = None
+
+def enable_webdriver_timeline() -> WebDriverTimeline:
+    """
+    Record the WebDriver commands of every browser started from now on.
+
+    Returns:
+        WebDriverTimeline: The timeline browsers are attached to
+    """
+    global webdriver_timeline
+    webdriver_timeline = WebDriverTimeline()
+    return webdriver_timeline
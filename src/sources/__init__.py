@@ -0,0 +1,38 @@
+from .base import SolutionSource
+from .fake_source import FakeSource
+
+SOURCES = ['selenium', 'http', 'fake']
+
+def get_source(name: str, **options) -> SolutionSource:
+    """
+    Create a solution source.
+    
+    Browser based sources are imported on demand, so the fake source can be
+    used without loading Selenium.
+    
+    Args:
+        name: One of SOURCES
+        **options: Arguments of the source's constructor
+        
+    Returns:
+        SolutionSource: The source instance
+        
+    Raises:
+        ValueError: If the source is unknown
+    """
+    if name == 'selenium':
+        from .selenium_source import SeleniumSource
+        return SeleniumSource(**options)
+    if name == 'http':
+        from .http_source import HttpSource
+        return HttpSource(**options)
+    if name == 'fake':
+        return FakeSource(**options)
+    raise ValueError(f"Unknown solution source: {name}")
+
+__all__ = [
+    'SolutionSource',
+    'FakeSource',
+    'SOURCES',
+    'get_source'
+]
@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from auth import Credentials
+
+class SolutionSource(ABC):
+    """
+    Interface of the places completed solutions are listed from.
+    
+    Solutions are items with name, level, language, code and completion
+    date, listed newest first.
+    """
+    
+    name = "base"
+    
+    @abstractmethod
+    def login(self, credentials: 'Credentials') -> None:
+        """
+        Authenticate to the source.
+        
+        Args:
+            credentials: User credentials
+            
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+    
+    @abstractmethod
+    def iter_solutions(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        List completed solutions, fetching more as they are consumed.
+        
+        Yields:
+            Dict: Items with name, level, language, code and completion date
+        """
+    
+    def save_session(self) -> None:
+        """Persist the session of the last sign in, if the source keeps one."""
+    
+    def close(self) -> None:
+        """Release resources held by the source."""
+    
+    def __enter__(self) -> 'SolutionSource':
+        """Use the source as a context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the source."""
+        self.close()
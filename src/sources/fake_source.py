@@ -0,0 +1,87 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Iterator, Optional
+from .base import SolutionSource
+
+if TYPE_CHECKING:
+    from auth import Credentials
+
+# Language shares and solution sizes loosely follow real Codewars histories
+LANGUAGES = {
+    "python": 35, "javascript": 25, "typescript": 6, "java": 6, "cpp": 6,
+    "c": 5, "csharp": 4, "rust": 4, "go": 3, "ruby": 3, "haskell": 2, "sql": 1
+}
+LEVELS = ["8 kyu", "7 kyu", "6 kyu", "5 kyu", "4 kyu", "3 kyu", "2 kyu", "1 kyu"]
+LEVEL_WEIGHTS = [20, 25, 25, 15, 8, 4, 2, 1]
+
+def generate_solution(index: int, total: int, seed: int = 0) -> Dict[str, Optional[str]]:
+    """
+    Generate a deterministic synthetic solution.
+    
+    Solutions are numbered from the oldest, so a longer history only adds
+    newer solutions on top of the same older ones.
+    
+    Args:
+        index: Position of the solution in the history, 0 being the newest
+        total: Number of solutions in the history
+        seed: Seed varying the generated history
+        
+    Returns:
+        Dict: Item with name, level, language, code and completion date
+    """
+    number = total - index
+    rng = random.Random(seed * 1_000_003 + number)
+    
+    # Some katas are solved again in another language, and a few are still in beta
+    kata_number = rng.randint(1, number) if rng.random() < 0.05 else number
+    level = "beta" if rng.random() < 0.025 else rng.choices(LEVELS, LEVEL_WEIGHTS)[0]
+    language = rng.choices(list(LANGUAGES), list(LANGUAGES.values()))[0]
+    
+    line_count = min(200, max(1, int(rng.lognormvariate(2.3, 0.8))))
+    lines = [f"def solution_{kata_number}(values):"]
+    lines.extend(f"    step_{i} = [v * {rng.randint(1, 99)} for v in values if v > {i}]"
+                 for i in range(line_count))
+    lines.append("    return values")
+    
+    completed_at = datetime(2015, 1, 1, tzinfo=timezone.utc) + timedelta(hours=2 * number)
+    return {
+        'name': f"Synthetic Kata {kata_number}",
+        'level': level,
+        'language': language,
+        'code': "\n".join(lines),
+        'completed_at': completed_at.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    }
+
+class FakeSource(SolutionSource):
+    """
+    Deterministic in-memory source of synthetic solutions.
+    
+    Generates the same history for the same count and seed, without any
+    browser or network access, to test and benchmark the export path.
+    """
+    
+    name = "fake"
+    
+    def __init__(self, count: int = 1000, seed: int = 0):
+        """
+        Initialize the fake source.
+        
+        Args:
+            count: Number of solutions in the history
+            seed: Seed varying the generated history
+        """
+        self.count = count
+        self.seed = seed
+    
+    def login(self, credentials: 'Credentials') -> None:
+        """Accept any credentials."""
+    
+    def iter_solutions(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        List the synthetic solutions, newest first.
+        
+        Yields:
+            Dict: Items with name, level, language, code and completion date
+        """
+        for index in range(self.count):
+            yield generate_solution(index, self.count, self.seed)
@@ -0,0 +1,57 @@
+import logging
+from itertools import chain
+from typing import Dict, Iterator, Optional
+import web_scraper
+from gvars import app_state
+from auth import Credentials
+from .selenium_source import SeleniumSource
+
+logger = logging.getLogger(__name__)
+
+class HttpSource(SeleniumSource):
+    """
+    Signs in with Chrome, then lists solutions over plain HTTP.
+    
+    The browser is closed as soon as its cookies are copied into a pooled
+    keep-alive HTTP session.
+    """
+    
+    name = "http"
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the HTTP source with the same options as SeleniumSource."""
+        super().__init__(*args, **kwargs)
+        self._session = None
+    
+    def login(self, credentials: Credentials) -> None:
+        """
+        Sign in with the browser and hand its session over to HTTP.
+        
+        Args:
+            credentials: User credentials
+            
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        super().login(credentials)
+        self._session = web_scraper.create_http_session(app_state.web_driver)
+        super().close()
+        logger.info("Browser closed, listing solutions over HTTP")
+    
+    def iter_solutions(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        List solutions by fetching the completed solutions page and its fragments.
+        
+        Returns:
+            Iterator[Dict]: Items with name, level, language, code and completion date
+        """
+        return chain.from_iterable(
+            web_scraper.iter_http_solution_batches(self._session, self.solutions_url, self.scroll_timeout)
+        )
+    
+    def close(self) -> None:
+        """Close the HTTP session and the browser if it is still running."""
+        if self._session:
+            self._session.close()
+            self._session = None
+        super().close()
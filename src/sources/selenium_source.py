@@ -0,0 +1,104 @@
+import logging
+from itertools import chain
+from typing import Dict, Iterator, List, Optional
+import utils
+import web_scraper
+from gvars import app_state
+from metrics import metrics
+from auth import Credentials, CredentialsValidator, SessionStore
+from .base import SolutionSource
+
+logger = logging.getLogger(__name__)
+
+class SeleniumSource(SolutionSource):
+    """Lists solutions by scrolling the completed solutions page in Chrome."""
+    
+    name = "selenium"
+    
+    def __init__(self, base_url: str, username: str, session_store: Optional[SessionStore] = None,
+                 lean: bool = False, auth_timeout: float = 10, prune_dom: bool = True,
+                 scroll_timeout: float = 10, max_browser_rss: Optional[int] = None):
+        """
+        Initialize the Selenium source.
+        
+        Args:
+            base_url: Base URL of Codewars
+            username: Codewars username
+            session_store: Store of the saved session, None to sign in every time
+            lean: Whether to block static assets and trackers
+            auth_timeout: Maximum wait for the outcome of a sign in attempt, in seconds
+            prune_dom: Whether to detach processed solutions from the page
+            scroll_timeout: Maximum wait for new solutions after each scroll, in seconds
+            max_browser_rss: Chrome memory in bytes above which it is restarted while
+                scrolling, None to never restart it
+        """
+        self.base_url = base_url
+        self.username = username
+        self.session_store = session_store
+        self.lean = lean
+        self.auth_timeout = auth_timeout
+        self.prune_dom = prune_dom
+        self.scroll_timeout = scroll_timeout
+        self.max_browser_rss = max_browser_rss
+        # Cookies of the last sign in, saved once the caller validated the repository
+        self._unsaved_cookies: Optional[List[Dict]] = None
+    
+    @property
+    def solutions_url(self) -> str:
+        """Get the URL of the completed solutions page."""
+        return f"{self.base_url}/users/{self.username}/completed_solutions"
+    
+    def login(self, credentials: Credentials) -> None:
+        """
+        Start the browser and sign in, restoring the saved session when possible.
+        
+        Args:
+            credentials: User credentials
+            
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        utils.start_browser_session(self.lean)
+        if self.session_store:
+            with metrics.timer('session_restore'):
+                restored = self.session_store.restore(app_state.web_driver, self.base_url)
+            if restored:
+                return
+            
+        utils.navigate(f"{self.base_url}/users/sign_in")
+        logger.info("Connecting to your Codewars account...")
+        
+        validator = CredentialsValidator(app_state.web_driver, timeout=self.auth_timeout)
+        validator.authenticate(credentials)
+        if self.session_store:
+            self._unsaved_cookies = app_state.web_driver.get_cookies()
+    
+    def save_session(self) -> None:
+        """Save the cookies of the last sign in to the session store."""
+        if self.session_store and self._unsaved_cookies:
+            self.session_store.save(self._unsaved_cookies)
+            self._unsaved_cookies = None
+    
+    def iter_solutions(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        List solutions loaded by scrolling the completed solutions page.
+        
+        Yields:
+            Dict: Items with name, level, language, code and completion date
+        """
+        utils.navigate(self.solutions_url)
+        stats = web_scraper.ScrapeStats()
+        watchdog = utils.BrowserMemoryWatchdog(self.max_browser_rss, self.lean)
+        try:
+            yield from chain.from_iterable(
+                web_scraper.iter_solution_batches(
+                    self.prune_dom, self.scroll_timeout, stats, watchdog, self.solutions_url
+                )
+            )
+        finally:
+            stats.log_summary()
+    
+    def close(self) -> None:
+        """Quit the browser."""
+        if app_state.web_driver:
+            app_state.cleanup()
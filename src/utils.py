@@ -1,9 +1,11 @@
 """Utility functions for browser automation and system operations."""
 
 import os
+import time
 import platform
 import logging
-from typing import Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -11,30 +13,84 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from webdriver_manager import ChromeDriverManager
+from auth.session import set_browser_cookies
 from gvars import app_state
+from metrics import metrics
+import profiling
 
 logger = logging.getLogger(__name__)
 
-def start_browser_session() -> None:
-    """Initialize and configure Chrome WebDriver session."""
+# URL patterns blocked in lean mode: static assets not needed to read solutions,
+# and third-party analytics, ads and trackers
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*facebook.net*", "*hotjar.com*", "*segment.io*",
+    "*segment.com*", "*carbonads.net*", "*buysellads.com*", "*intercom.io*",
+]
+
+def start_browser_session(lean: bool = False) -> None:
+    """
+    Initialize and configure Chrome WebDriver session.
+    
+    Args:
+        lean: Whether to block images, fonts, stylesheets and trackers and
+            return from page loads as soon as the DOM is ready
+    """
     options = webdriver.ChromeOptions()
     options.add_argument("no-sandbox")
     options.add_argument("--disable-gpu")
     options.add_argument('--headless')
     options.add_argument("--disable-dev-shm-usage")
     
+    if lean:
+        options.page_load_strategy = 'eager'
+        # Fonts, stylesheets and trackers have no content setting, they are
+        # blocked through the DevTools protocol once the session is started
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+    
     try:
         manager = ChromeDriverManager(os.path.dirname(__file__))
-        manager.update_if_needed()
+        with metrics.timer('chromedriver_check'):
+            manager.update_if_needed()
         
         service = webdriver.chrome.service.Service(executable_path=manager.driver_path)
-        app_state.web_driver = webdriver.Chrome(options=options, service=service)
-        logger.info("Browser session started successfully")
+        with metrics.timer('browser_start'):
+            app_state.web_driver = webdriver.Chrome(options=options, service=service)
+        if profiling.webdriver_timeline:
+            profiling.webdriver_timeline.attach(app_state.web_driver)
+        
+        if lean:
+            app_state.web_driver.execute_cdp_cmd('Network.enable', {})
+            app_state.web_driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URLS})
+            
+        logger.info(f"Browser session started successfully{' (lean mode)' if lean else ''}")
         
     except Exception as e:
         logger.error(f"Failed to start browser session: {str(e)}")
         exit(1)
 
+def navigate(url: str) -> float:
+    """
+    Load a page and log how long it took.
+    
+    Args:
+        url: URL to load
+        
+    Returns:
+        float: Page load duration in seconds
+    """
+    start = time.perf_counter()
+    app_state.web_driver.get(url)
+    duration = time.perf_counter() - start
+    metrics.observe('page_load', duration)
+    logger.info(f"Loaded {url} in {duration:.2f}s")
+    return duration
+
 def wait_for_element(by: By, value: str, timeout: int = 10) -> Optional[webdriver.remote.webelement.WebElement]:
     """
     Wait for element to be present and visible.
@@ -74,6 +130,188 @@ def wait_for_page_load(timeout: int = 10) -> bool:
     except TimeoutException:
         return False
 
+def get_process_tree_rss(pid: int) -> Optional[int]:
+    """
+    Get the resident memory of a process and all its descendants.
+    
+    Args:
+        pid: Root process ID
+        
+    Returns:
+        Optional[int]: Resident memory in bytes, None if /proc is not available
+    """
+    if not os.path.isdir('/proc'):
+        return None
+        
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces, the parent ID follows its closing parenthesis
+        parent = int(stat[stat.rfind(b')') + 2:].split()[1])
+        children.setdefault(parent, []).append(int(entry))
+        
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            continue
+        pending.extend(children.get(current, []))
+    return total
+
+def get_browser_rss() -> Optional[int]:
+    """
+    Get the resident memory of chromedriver and the Chrome processes it started.
+    
+    Returns:
+        Optional[int]: Resident memory in bytes, None if unavailable
+    """
+    try:
+        pid = app_state.web_driver.service.process.pid
+    except AttributeError:
+        return None
+    return get_process_tree_rss(pid)
+
+def is_browser_alive() -> bool:
+    """
+    Check whether the browser still answers WebDriver commands.
+    
+    Returns:
+        bool: True if a browser is running and responding
+    """
+    if not app_state.web_driver:
+        return False
+    try:
+        app_state.web_driver.current_url
+        return True
+    except Exception:
+        # Crashed renderers raise WebDriverException, a dead chromedriver connection errors
+        return False
+
+class BrowserMemoryWatchdog:
+    """
+    Restarts the browser when its memory crosses a ceiling during a long scrape.
+    
+    Chrome's process tree RSS is sampled between scroll batches. Above the
+    ceiling, the browser is restarted with the session cookies of the old
+    one, so the scrape can resume without signing in again. The ceiling is
+    ignored after max_restarts restarts, or once disabled, so a ceiling
+    below the page's steady-state memory cannot restart the browser forever.
+    """
+    
+    def __init__(self, ceiling: Optional[int], lean: bool = False, max_restarts: int = 10):
+        """
+        Initialize the watchdog.
+        
+        Args:
+            ceiling: Chrome process tree RSS in bytes above which it is restarted, None to disable
+            lean: Whether restarted browsers block static assets and trackers
+            max_restarts: Number of restarts after which the ceiling is ignored
+        """
+        self.ceiling = ceiling
+        self.lean = lean
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        
+    def exceeded(self) -> bool:
+        """
+        Check whether the browser uses more memory than the ceiling.
+        
+        Returns:
+            bool: True if the browser should be restarted
+        """
+        if not self.ceiling:
+            return False
+        rss = get_browser_rss()
+        if rss is None or rss <= self.ceiling:
+            return False
+        logger.warning(f"Chrome uses {rss / 2**20:.0f} MB, above the {self.ceiling / 2**20:.0f} MB ceiling")
+        if self.restarts >= self.max_restarts:
+            self.disable(f"the browser was already restarted {self.restarts} time(s)")
+            return False
+        return True
+        
+    def disable(self, reason: str) -> None:
+        """
+        Stop restarting the browser for the rest of the scrape.
+        
+        Args:
+            reason: Why the ceiling is ignored, for the log
+        """
+        if self.ceiling:
+            logger.warning(f"Ignoring the {self.ceiling / 2**20:.0f} MB memory ceiling for the rest of the scrape: {reason}")
+        self.ceiling = None
+        
+    def restart_browser(self) -> None:
+        """Restart the browser, carrying the session cookies over to the new one."""
+        cookies = app_state.web_driver.get_cookies()
+        app_state.cleanup()
+        start_browser_session(self.lean)
+        set_browser_cookies(app_state.web_driver, cookies)
+        self.restarts += 1
+        metrics.increment('browser_restarts')
+        logger.info(f"Browser restarted with the current session ({self.restarts} restart(s) so far)")
+
+class BackgroundTask:
+    """
+    Runs a function in a background thread and hands its outcome back on join.
+    
+    Any exception raised by the function, SystemExit included, is re-raised
+    in the joining thread instead of being lost with the background thread.
+    """
+    
+    def __init__(self, func: Callable[..., Any], *args: Any, name: str = "background-task"):
+        """
+        Initialize the task.
+        
+        Args:
+            func: Function to run
+            *args: Arguments of the function
+            name: Name of the thread
+        """
+        self._func = func
+        self._args = args
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        
+    def _run(self) -> None:
+        """Run the function, keeping its result or error."""
+        try:
+            self._result = self._func(*self._args)
+        except BaseException as e:
+            self._error = e
+            
+    def start(self) -> 'BackgroundTask':
+        """Start the task."""
+        self._thread.start()
+        return self
+        
+    def join(self) -> Any:
+        """
+        Wait for the task to finish.
+        
+        Returns:
+            Any: Return value of the function
+            
+        Raises:
+            BaseException: The function's error, if it failed
+        """
+        self._thread.join()
+        if self._error:
+            raise self._error
+        return self._result
+
 def clear_console() -> None:
     """Clear console based on operating system."""
     os.system('clear' if platform.system() == 'Linux' else 'cls')
\ No newline at end of file
@@ -0,0 +1,49 @@
+import logging
+from .base import VcsBackend
+from .subprocess_backend import SubprocessBackend
+from .fast_import import FastImportSession
+from .exceptions import VcsError, BackendUnavailableError
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ['auto', 'dulwich', 'subprocess']
+
+def get_backend(name: str = 'auto') -> VcsBackend:
+    """
+    Create a version control backend.
+    
+    'auto' prefers the in-process dulwich backend and falls back to
+    the git command line when dulwich is not installed.
+    
+    Args:
+        name: One of BACKENDS
+        
+    Returns:
+        VcsBackend: The backend instance
+        
+    Raises:
+        BackendUnavailableError: If the backend is unknown or cannot be loaded
+    """
+    if name not in BACKENDS:
+        raise BackendUnavailableError(f"Unknown VCS backend: {name}")
+        
+    if name in ('auto', 'dulwich'):
+        try:
+            from .dulwich_backend import DulwichBackend
+            return DulwichBackend()
+        except ImportError:
+            if name == 'dulwich':
+                raise BackendUnavailableError("The dulwich backend requires the 'dulwich' package")
+            logger.info("dulwich is not installed, using the git command line")
+            
+    return SubprocessBackend()
+
+__all__ = [
+    'VcsBackend',
+    'SubprocessBackend',
+    'FastImportSession',
+    'VcsError',
+    'BackendUnavailableError',
+    'BACKENDS',
+    'get_backend'
+]
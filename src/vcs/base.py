@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+class VcsBackend(ABC):
+    """Interface of the version control operations used by the exporter."""
+    
+    name = "base"
+    
+    @abstractmethod
+    def is_repository(self, path: str) -> bool:
+        """
+        Check if a directory is inside a Git working tree.
+        
+        Args:
+            path: Path to check
+            
+        Returns:
+            bool: True if path is inside a Git working tree
+        """
+    
+    @abstractmethod
+    def commit(self, repo_path: str, paths: List[str], message: str) -> None:
+        """
+        Stage the given files and commit them.
+        
+        Args:
+            repo_path: Path to the repository
+            paths: Paths of the files to commit, relative to repo_path
+            message: Commit message
+            
+        Raises:
+            VcsError: If the commit fails
+        """
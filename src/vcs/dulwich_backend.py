@@ -0,0 +1,75 @@
+import os
+from typing import Dict, List
+from dulwich import porcelain
+from dulwich.errors import NotGitRepository
+from dulwich.objects import Tree
+from dulwich.object_store import commit_tree_changes
+from dulwich.repo import Repo
+from .base import VcsBackend
+from .exceptions import VcsError
+
+class DulwichBackend(VcsBackend):
+    """
+    In-process backend built on dulwich.
+    
+    Blobs, trees and commits are written straight to the object store,
+    without spawning any git process.
+    """
+    
+    name = "dulwich"
+    
+    def __init__(self):
+        """Initialize the backend with an empty repository cache."""
+        self._repos: Dict[str, Repo] = {}
+    
+    def _open(self, repo_path: str) -> Repo:
+        """Open a repository, reusing already opened ones."""
+        key = os.path.abspath(repo_path)
+        if key not in self._repos:
+            self._repos[key] = Repo(key)
+        return self._repos[key]
+    
+    def is_repository(self, path: str) -> bool:
+        """Check if a directory is inside a non-bare Git repository."""
+        try:
+            repo = Repo.discover(path)
+        except NotGitRepository:
+            return False
+        try:
+            return not repo.bare
+        finally:
+            repo.close()
+    
+    def commit(self, repo_path: str, paths: List[str], message: str) -> None:
+        """
+        Stage the given files and commit only them, like git commit -- paths.
+        
+        The committed tree is HEAD's tree with the given files updated, so
+        changes the user staged for other files stay out of the commit and
+        remain staged.
+        """
+        repo = self._open(repo_path)
+        try:
+            porcelain.add(repo, paths=[os.path.join(repo.path, path) for path in paths])
+            index = repo.open_index()
+            changes = []
+            for path in paths:
+                name = path.replace(os.sep, '/').encode('utf-8')
+                entry = index[name] if name in index else None
+                changes.append((name, entry.mode, entry.sha) if entry else (name, None, None))
+            try:
+                head_tree = repo[repo.head()].tree
+            except KeyError:
+                # First commit of the repository
+                head_tree = Tree()
+                repo.object_store.add_object(head_tree)
+            tree = commit_tree_changes(repo.object_store, head_tree, changes)
+            repo.get_worktree().commit(message=message.encode('utf-8'), tree=tree)
+        except Exception as e:
+            raise VcsError(f"dulwich commit failed: {e}")
+    
+    def close(self) -> None:
+        """Close every opened repository."""
+        for repo in self._repos.values():
+            repo.close()
+        self._repos.clear()
@@ -0,0 +1,7 @@
+class VcsError(Exception):
+    """Base exception for version control errors."""
+    pass
+
+class BackendUnavailableError(VcsError):
+    """Exception raised when a requested backend cannot be used."""
+    pass
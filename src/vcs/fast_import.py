@@ -0,0 +1,111 @@
+import subprocess
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
+from .exceptions import VcsError
+
+class FastImportSession:
+    """
+    Streams commits into a single git fast-import process.
+    
+    Commits are chained on top of the currently checked out branch,
+    which is updated once the stream is closed.
+    """
+    
+    def __init__(self, repo_path: str):
+        """
+        Initialize the session.
+        
+        Args:
+            repo_path: Path to the repository
+        """
+        self.repo_path = repo_path
+        self._process: Optional[subprocess.Popen] = None
+        self._ref = ""
+        self._parent: Optional[str] = None
+        self._identity = ""
+        self.commit_count = 0
+    
+    def _git(self, *args: str) -> str:
+        """Run a git command and return its stripped output, empty on failure."""
+        result = subprocess.run(
+            ['git', *args], cwd=self.repo_path, capture_output=True, text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else ""
+    
+    def __enter__(self) -> 'FastImportSession':
+        """Start the fast-import process."""
+        self._ref = self._git('symbolic-ref', '-q', 'HEAD')
+        if not self._ref:
+            raise VcsError("Cannot backfill a repository with a detached HEAD")
+        self._parent = self._git('rev-parse', '-q', '--verify', 'HEAD') or None
+        
+        name = self._git('config', 'user.name')
+        email = self._git('config', 'user.email')
+        if not name or not email:
+            raise VcsError("git user.name and user.email must be configured to backfill")
+        self._identity = f"{name} <{email}>"
+        
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'fast-import', '--quiet', '--date-format=raw'],
+                cwd=self.repo_path, stdin=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            raise VcsError(f"Failed to start git fast-import: {e}")
+        return self
+    
+    def _write_data(self, data: Union[bytes, memoryview]) -> None:
+        """Write a counted data block."""
+        self._process.stdin.write(b"data %d\n" % len(data))
+        self._process.stdin.write(data)
+        self._process.stdin.write(b"\n")
+    
+    def commit(self, files: Dict[str, Union[bytes, memoryview]], message: str,
+               author_date: Optional[datetime] = None) -> None:
+        """
+        Stream a commit replacing the content of the given files.
+        
+        Args:
+            files: Full content of each modified file, keyed by path relative to the repository,
+                as bytes or a view of a buffer only read during the call
+            message: Commit message
+            author_date: Author date (defaults to now)
+        """
+        now = int(datetime.now(timezone.utc).timestamp())
+        authored = int(author_date.timestamp()) if author_date else now
+        
+        stdin = self._process.stdin
+        try:
+            stdin.write(f"commit {self._ref}\n".encode())
+            stdin.write(f"author {self._identity} {authored} +0000\n".encode())
+            stdin.write(f"committer {self._identity} {now} +0000\n".encode())
+            self._write_data(message.encode('utf-8'))
+            if self.commit_count == 0 and self._parent:
+                stdin.write(f"from {self._parent}\n".encode())
+            for path, content in files.items():
+                stdin.write(f"M 100644 inline {path}\n".encode('utf-8'))
+                self._write_data(content)
+        except BrokenPipeError:
+            raise VcsError(f"git fast-import stopped: {self._process.stderr.read().decode().strip()}")
+        self.commit_count += 1
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the stream and wait for fast-import to update the branch."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        stderr = self._process.stderr.read().decode().strip()
+        if self._process.wait() != 0 and exc_type is None:
+            raise VcsError(f"git fast-import failed: {stderr}")
+    
+    def reset_index(self, paths: List[str]) -> None:
+        """
+        Refresh index entries of the given paths from the new HEAD.
+        
+        Args:
+            paths: Paths relative to the repository
+        """
+        subprocess.run(['git', 'reset', '-q', '--', *paths], cwd=self.repo_path, capture_output=True)
@@ -0,0 +1,42 @@
+import subprocess
+from typing import List
+from .base import VcsBackend
+from .exceptions import VcsError
+
+class SubprocessBackend(VcsBackend):
+    """Backend running the git command line tool."""
+    
+    name = "subprocess"
+    
+    def is_repository(self, path: str) -> bool:
+        """Check if a directory is inside a Git working tree using git rev-parse."""
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--is-inside-work-tree'],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except subprocess.CalledProcessError:
+            return False
+        except OSError as e:
+            raise VcsError(f"Failed to run git: {e}")
+        return result.stdout.strip() == 'true'
+    
+    def commit(self, repo_path: str, paths: List[str], message: str) -> None:
+        """Stage the given files with git add and commit only them."""
+        try:
+            subprocess.run(
+                ['git', 'add', '--', *paths],
+                cwd=repo_path, capture_output=True, check=True
+            )
+            subprocess.run(
+                ['git', 'commit', '-q', '-F', '-', '--', *paths],
+                cwd=repo_path, input=message, text=True, capture_output=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr
+            raise VcsError(f"git {e.cmd[1]} failed: {stderr.strip()}")
+        except OSError as e:
+            raise VcsError(f"Failed to run git: {e}")
@@ -2,14 +2,217 @@
 
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
-from typing import Optional, List
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple, Set
+from dataclasses import dataclass, field
+from datetime import datetime
+from urllib.parse import urljoin
+import time
 import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import utils
 from gvars import app_state
+from metrics import metrics
 from Kata import Kata
+from auth.exceptions import AuthenticationError
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
 
 logger = logging.getLogger(__name__)
 
+# Extracts every solution item not yet seen in a single WebDriver round trip.
+# Processed nodes are flagged with a data attribute so later scroll batches
+# only return newly loaded items, and detached when pruning is enabled so the
+# DOM does not grow with the history. DOM size and JS heap are reported too.
+EXTRACT_SOLUTIONS_SCRIPT = """
+const prune = arguments[0];
+const items = document.querySelectorAll('.list-item-solutions:not([data-ktas-seen])');
+const solutions = [];
+for (const item of items) {
+    item.setAttribute('data-ktas-seen', '1');
+    const title = item.querySelector('.item-title');
+    const link = title ? title.querySelector('a') : null;
+    const level = title ? title.querySelector('span') : null;
+    const markdown = item.querySelector('.markdown');
+    const code = markdown ? markdown.querySelector('code') : null;
+    const completed = item.querySelector('time-ago[datetime], time[datetime]');
+    solutions.push({
+        name: link ? link.innerText.trim() : null,
+        level: level ? level.innerText.trim() : null,
+        language: code ? (code.getAttribute('data-language') || '').toLowerCase() : null,
+        code: code ? code.textContent : null,
+        completed_at: completed ? completed.getAttribute('datetime') : null
+    });
+    if (prune) {
+        item.remove();
+    }
+}
+return {
+    solutions: solutions,
+    dom_size: document.getElementsByTagName('*').length,
+    js_heap: performance.memory ? performance.memory.usedJSHeapSize : null
+};
+"""
+
+# Scrolls the infinite marker into view, then resolves as soon as new solution
+# items are added, once the marker stayed absent for a grace period after the
+# last mutation (the last page is loaded), or when the timeout expires. A
+# MutationObserver avoids polling from Python.
+WAIT_FOR_SOLUTIONS_SCRIPT = """
+const timeoutMs = arguments[0];
+const pendingFirst = arguments[1];
+const markerGraceMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const countItems = () => document.getElementsByClassName('list-item-solutions').length;
+const countPending = () => document.querySelectorAll('.list-item-solutions:not([data-ktas-seen])').length;
+const baseline = countItems();
+let scrolled = false;
+let finished = false;
+let graceTimer = null;
+const scroll = () => {
+    const marker = document.querySelector('.js-infinite-marker');
+    if (marker && !scrolled) {
+        marker.scrollIntoView();
+        scrolled = true;
+    }
+};
+const finish = (loaded) => {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearTimeout(graceTimer);
+    done({loaded: loaded, marker: document.querySelector('.js-infinite-marker') !== null});
+};
+const check = () => {
+    if (countItems() > baseline || (pendingFirst && countPending() > 0)) {
+        finish(true);
+        return;
+    }
+    scroll();
+    // The marker may be swapped while a page loads, only give up once it stays gone
+    clearTimeout(graceTimer);
+    graceTimer = document.querySelector('.js-infinite-marker') ? null : setTimeout(() => finish(false), markerGraceMs);
+};
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(countItems() > baseline), timeoutMs);
+observer.observe(document.body, {childList: true, subtree: true});
+check();
+"""
+
+# Attributes of the infinite marker that may hold the URL of the next page
+MARKER_URL_ATTRIBUTES = ['data-url', 'data-next-url', 'data-href', 'href']
+
+# Gets the URL of the next page the infinite marker would load
+SCROLL_CHECKPOINT_SCRIPT = """
+const marker = document.querySelector('.js-infinite-marker');
+if (!marker) {
+    return null;
+}
+for (const name of arguments[0]) {
+    if (marker.getAttribute(name)) {
+        return marker.getAttribute(name);
+    }
+}
+return null;
+"""
+
+# Points the infinite marker of a freshly loaded page at a checkpoint, then
+# drops the already processed first page so the marker comes into view
+RESUME_SCROLL_SCRIPT = """
+const names = arguments[0];
+const nextUrl = arguments[1];
+const marker = document.querySelector('.js-infinite-marker');
+const name = marker ? names.find((name) => marker.getAttribute(name)) : null;
+if (!name) {
+    return false;
+}
+marker.setAttribute(name, nextUrl);
+for (const item of document.querySelectorAll('.list-item-solutions')) {
+    item.remove();
+}
+return true;
+"""
+
+# Time the infinite marker must stay absent before the history is considered complete
+MARKER_GRACE_PERIOD = 0.5
+
+class ScrapeTimeoutError(Exception):
+    """Raised when no solutions are loaded in time although more are announced."""
+
+@dataclass
+class ScrapeStats:
+    """
+    Per-batch browser statistics of a scrape.
+    
+    Attributes:
+        batches: Number of extracted batches
+        items: Number of extracted solution items
+        peak_dom_size: Largest DOM node count seen after a batch
+        peak_js_heap: Largest JS heap seen after a batch, in bytes
+        peak_browser_rss: Largest Chrome process tree RSS seen after a batch, in bytes
+        scroll_latencies: Time spent waiting for each scroll to load solutions, in seconds
+    """
+    
+    batches: int = 0
+    items: int = 0
+    peak_dom_size: int = 0
+    peak_js_heap: int = 0
+    peak_browser_rss: int = 0
+    scroll_latencies: List[float] = field(default_factory=list)
+    
+    def record_batch(self, items: int, dom_size: Optional[int], js_heap: Optional[int]) -> None:
+        """Record the statistics of an extracted batch."""
+        browser_rss = utils.get_browser_rss()
+        self.batches += 1
+        self.items += items
+        self.peak_dom_size = max(self.peak_dom_size, dom_size or 0)
+        self.peak_js_heap = max(self.peak_js_heap, js_heap or 0)
+        self.peak_browser_rss = max(self.peak_browser_rss, browser_rss or 0)
+        metrics.increment('scroll_batches')
+        metrics.increment('solutions_extracted', items)
+        metrics.set_max('dom_nodes_peak', self.peak_dom_size)
+        metrics.set_max('js_heap_peak_bytes', self.peak_js_heap)
+        metrics.set_max('browser_rss_peak_bytes', self.peak_browser_rss)
+        logger.debug(
+            f"Batch {self.batches}: {items} item(s), DOM {dom_size} nodes, "
+            f"JS heap {_megabytes(js_heap)}, Chrome RSS {_megabytes(browser_rss)}"
+        )
+    
+    def record_scroll(self, latency: float) -> None:
+        """Record how long a scroll took to load new solutions."""
+        self.scroll_latencies.append(latency)
+        metrics.observe('scroll_wait', latency)
+        logger.debug(f"Scroll {len(self.scroll_latencies)}: {latency * 1000:.0f} ms")
+    
+    def log_summary(self) -> None:
+        """Log a summary of the scrape."""
+        if self.batches:
+            logger.info(
+                f"Scraped {self.items} item(s) in {self.batches} batch(es), peak DOM {self.peak_dom_size} nodes, "
+                f"peak JS heap {_megabytes(self.peak_js_heap)}, peak Chrome RSS {_megabytes(self.peak_browser_rss)}"
+            )
+        if self.scroll_latencies:
+            latencies = sorted(self.scroll_latencies)
+            logger.info(
+                f"Scroll latency over {len(latencies)} scroll(s): "
+                f"avg {sum(latencies) / len(latencies) * 1000:.0f} ms, "
+                f"p95 {latencies[int(0.95 * (len(latencies) - 1))] * 1000:.0f} ms, "
+                f"max {latencies[-1] * 1000:.0f} ms"
+            )
+
+def _megabytes(size: Optional[int]) -> str:
+    """Format a size in bytes as megabytes."""
+    return f"{size / (1024 * 1024):.1f} MB" if size else "n/a"
+
 def get_kata_code(element) -> str:
     """Extract code from a kata solution element."""
     return BeautifulSoup(
@@ -25,82 +228,433 @@ def get_kata_level(element) -> str:
     """Extract difficulty level from a kata solution element."""
     return element.find_element(By.TAG_NAME, 'span').text
 
+def get_kata_completion_date(element) -> Optional[str]:
+    """Extract the ISO completion date from a kata solution element, if displayed."""
+    dates = element.find_elements(By.CSS_SELECTOR, 'time-ago[datetime], time[datetime]')
+    return dates[0].get_attribute('datetime') if dates else None
+
+def parse_completion_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO completion date, returning None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning(f"Ignoring invalid completion date: {value}")
+        return None
+
 def get_kata_language(element) -> str:
     """Extract programming language from a kata solution element."""
     return element.find_element(By.TAG_NAME, 'code').get_attribute('data-language').lower()
 
-def load_more_solutions() -> bool:
+def load_more_solutions(timeout: float = 10, pending_first: bool = True,
+                        stats: Optional[ScrapeStats] = None) -> bool:
     """
-    Load more solutions by scrolling to the infinite marker.
+    Load more solutions by scrolling to the infinite marker and waiting for them.
+    
+    Waits in the browser until new solutions are added to the page, the
+    marker stays gone for MARKER_GRACE_PERIOD or the timeout expires,
+    whichever comes first.
     
+    Args:
+        timeout: Maximum wait in seconds
+        pending_first: Whether unseen solutions already on the page count as loaded
+        stats: Statistics updated with the scroll latency (optional)
+        
     Returns:
-        bool: True if more solutions were loaded, False otherwise
+        bool: True if more solutions were loaded, False at the end of the history
+        
+    Raises:
+        ScrapeTimeoutError: If the timeout expired while the marker announces more solutions
     """
+    driver = app_state.web_driver
+    start = time.perf_counter()
     try:
-        element = app_state.web_driver.find_element(By.CLASS_NAME, 'js-infinite-marker')
-        app_state.web_driver.execute_script("arguments[0].scrollIntoView();", element)
+        driver.set_script_timeout(timeout + 5)
+        result = driver.execute_async_script(
+            WAIT_FOR_SOLUTIONS_SCRIPT, int(timeout * 1000), pending_first, int(MARKER_GRACE_PERIOD * 1000)
+        ) or {}
+    except WebDriverException as e:
+        logger.warning(f"Scroll wait failed, falling back to a blind scroll: {str(e)}")
+        marker = utils.wait_for_element(By.CLASS_NAME, 'js-infinite-marker', timeout)
+        if marker is None:
+            return False
+        driver.execute_script("arguments[0].scrollIntoView();", marker)
         return True
-    except NoSuchElementException:
-        return False
+    finally:
+        if stats:
+            stats.record_scroll(time.perf_counter() - start)
+            
+    if not result.get('loaded') and result.get('marker'):
+        # Ending here would pass a truncated history off as a complete one
+        raise ScrapeTimeoutError(
+            f"No new solutions after {timeout}s although more are announced, "
+            "the history was not scraped to the end (see SCROLL_TIMEOUT)"
+        )
+    return bool(result.get('loaded'))
 
-def extract_kata_from_solution(solution) -> Optional[Kata]:
+def read_solution_element(solution) -> Optional[Dict[str, Optional[str]]]:
     """
-    Extract kata information from a solution element.
+    Read kata information from a solution element, one round trip at a time.
     
     Args:
         solution: The web element containing the solution
         
+    Returns:
+        Optional[Dict]: Item with name, level, language and code, None if unreadable
+    """
+    try:
+        title = solution.find_element(By.CLASS_NAME, 'item-title')
+        markdown_elements = solution.find_elements(By.CLASS_NAME, 'markdown')
+        return {
+            'name': get_kata_name(title),
+            'level': get_kata_level(title),
+            'language': get_kata_language(markdown_elements[0]) if markdown_elements else None,
+            'code': get_kata_code(markdown_elements[0]) if markdown_elements else None,
+            'completed_at': get_kata_completion_date(solution)
+        }
+        
+    except NoSuchElementException as e:
+        logger.warning(f"Failed to extract kata from solution: {str(e)}")
+        return None
+
+def extract_kata_from_item(item: Dict[str, Optional[str]]) -> Optional[Kata]:
+    """
+    Build a kata from an item returned by the batch extraction script.
+    
+    Args:
+        item: Dictionary holding name, level, language, code and completion date
+        
     Returns:
         Optional[Kata]: A Kata object if valid, None otherwise
     """
+    kata_name = item.get('name')
+    if not kata_name or app_state.is_kata_pushed(kata_name, item.get('language') or ''):
+        return None
+        
+    kata_level = item.get('level') or ''
+    if "kyu" not in kata_level:
+        return None
+        
+    if item.get('code') is None:
+        return None
+        
+    return Kata(
+        kata_name,
+        kata_level,
+        item.get('language') or '',
+        item['code'],
+        parse_completion_date(item.get('completed_at'))
+    )
+
+def fetch_solution_batch(prune: bool = True,
+                         stats: Optional[ScrapeStats] = None) -> Optional[List[Dict[str, Optional[str]]]]:
+    """
+    Extract every solution item not yet seen using a single script call.
+    
+    Args:
+        prune: Whether to detach extracted nodes from the DOM
+        stats: Statistics updated with the batch (optional)
+        
+    Returns:
+        Optional[List[Dict]]: Extracted items, None if the batch script failed
+    """
     try:
-        kata_name = get_kata_name(solution.find_element(By.CLASS_NAME, 'item-title'))
+        batch = app_state.web_driver.execute_script(EXTRACT_SOLUTIONS_SCRIPT, prune) or {}
+    except WebDriverException as e:
+        logger.warning(f"Batch extraction failed, falling back to per-element extraction: {str(e)}")
+        return None
         
-        if app_state.is_kata_pushed(kata_name):
-            return None
+    items = batch.get('solutions') or []
+    if stats:
+        stats.record_batch(len(items), batch.get('dom_size'), batch.get('js_heap'))
+    return items
+
+def read_solution_elements() -> Iterable[Dict[str, Optional[str]]]:
+    """
+    Read the solutions currently loaded on the page by walking their elements one by one.
+    
+    Returns:
+        Iterable[Dict]: Items with name, level, language and code
+    """
+    solutions = app_state.web_driver.find_elements(
+        By.CSS_SELECTOR, ".list-item-solutions:not([data-ktas-seen])"
+    )
+    return filter(None, (read_solution_element(solution) for solution in solutions))
+
+@dataclass
+class ScrapeCursor:
+    """
+    Tracks incremental scraping progress against the last exported kata.
+    
+    The solutions page is ordered newest-first, so scraping can stop as soon
+    as the stop marker is reached. Without a stop marker, a run of already
+    exported katas ends the scrape, but new katas may still hide below it,
+    so such a scrape is not exhaustive and never records a stop marker.
+    
+    Attributes:
+        stop_marker: Identity (name, language) of the newest exported kata
+        stop_after: Number of consecutive exported katas ending the scrape
+            while no stop marker is known
+        newest_seen: Identity of the first kata seen on the page
+        exhausted: Whether every kata down to the stop marker or the end of
+            the history was processed
+    """
+    
+    stop_marker: Optional[Tuple[str, str]] = None
+    stop_after: int = 0
+    newest_seen: Optional[Tuple[str, str]] = None
+    exhausted: bool = False
+    _consecutive_pushed: int = field(default=0, repr=False)
+    _seen: Set[Tuple[str, str]] = field(default_factory=set, repr=False)
+    
+    def should_stop(self, item: Dict[str, Optional[str]]) -> bool:
+        """
+        Record a solution item and tell whether scraping should stop before it.
+        
+        Args:
+            item: Item with name, level, language and code
             
-        kata_level = get_kata_level(solution.find_element(By.CLASS_NAME, 'item-title'))
-        if "kyu" not in kata_level:
-            return None
+        Returns:
+            bool: True if scraping should stop
+        """
+        kata_name = item.get('name')
+        if not kata_name or "kyu" not in (item.get('level') or ''):
+            return False
             
-        markdown_elements = solution.find_elements(By.CLASS_NAME, 'markdown')
-        if not markdown_elements:
-            return None
+        identity = (kata_name, item.get('language') or '')
+        if identity in self._seen:
+            return False
+        self._seen.add(identity)
+        
+        if self.newest_seen is None:
+            self.newest_seen = identity
+            
+        if identity == self.stop_marker:
+            logger.info(f"Reached last exported kata '{kata_name}', stopping")
+            self.exhausted = True
+            return True
+            
+        if app_state.is_kata_pushed(*identity):
+            self._consecutive_pushed += 1
+        else:
+            self._consecutive_pushed = 0
             
-        kata_language = get_kata_language(markdown_elements[0])
-        kata_code = get_kata_code(markdown_elements[0])
+        if self.stop_marker is None and self.stop_after and self._consecutive_pushed >= self.stop_after:
+            logger.info(f"Found {self._consecutive_pushed} consecutive exported katas, stopping")
+            return True
+        return False
+
+def restart_scroll(watchdog: utils.BrowserMemoryWatchdog, page_url: str) -> None:
+    """
+    Restart the browser in the middle of a scroll and resume where it stopped.
+    
+    The checkpoint is the URL of the next page the infinite marker would load.
+    If the new page cannot be pointed at it, scrolling starts over from the
+    top, already exported katas are skipped and the watchdog is disabled,
+    since every further restart would start over from the top again.
+    
+    Args:
+        watchdog: Watchdog restarting the browser
+        page_url: URL of the completed solutions page
+    """
+    next_url = app_state.web_driver.execute_script(SCROLL_CHECKPOINT_SCRIPT, MARKER_URL_ATTRIBUTES)
+    if next_url is None:
+        logger.info("No page left to load, keeping the browser until the end of the scrape")
+        return
         
-        return Kata(kata_name, kata_level, kata_language, kata_code)
+    logger.info(f"Checkpoint at {next_url}, restarting the browser")
+    watchdog.restart_browser()
+    utils.navigate(page_url)
+    if app_state.web_driver.execute_script(RESUME_SCROLL_SCRIPT, MARKER_URL_ATTRIBUTES, next_url):
+        logger.info(f"Resumed scrolling at {next_url}")
+    else:
+        logger.warning("Could not resume at the checkpoint, scrolling from the top again")
+        watchdog.disable("resuming at a checkpoint is not possible on this page")
+
+def iter_solution_batches(prune_dom: bool = True, scroll_timeout: float = 10,
+                          stats: Optional[ScrapeStats] = None,
+                          watchdog: Optional[utils.BrowserMemoryWatchdog] = None,
+                          page_url: Optional[str] = None) -> Iterator[Iterable[Dict[str, Optional[str]]]]:
+    """
+    Yield the solutions loaded in the browser, one batch per scroll.
+    
+    Args:
+        prune_dom: Whether to detach processed solutions from the page
+        scroll_timeout: Maximum wait for new solutions after each scroll, in seconds
+        stats: Statistics updated with each batch and scroll (optional)
+        watchdog: Watchdog checked after each batch, restarting the browser when
+            it uses too much memory (optional)
+        page_url: URL of the completed solutions page, reloaded after a restart
         
-    except NoSuchElementException as e:
-        logger.warning(f"Failed to extract kata from solution: {str(e)}")
-        return None
+    Yields:
+        Iterable[Dict]: Items with name, level, language and code
+        
+    Raises:
+        ScrapeTimeoutError: If a scroll times out before the end of the history
+    """
+    while True:
+        items = fetch_solution_batch(prune_dom, stats)
+        batched = items is not None
+        yield items if batched else read_solution_elements()
+        
+        # The batch has been consumed, the browser can be replaced before the next scroll
+        if watchdog and page_url and watchdog.exceeded():
+            restart_scroll(watchdog, page_url)
+        if not load_more_solutions(scroll_timeout, batched, stats):
+            return
 
-def get_completed_katas(push_step: int) -> List[Kata]:
+def iter_katas(items: Iterable[Dict[str, Optional[str]]],
+               limit: Optional[int] = None,
+               cursor: Optional[ScrapeCursor] = None) -> Iterator[Kata]:
     """
-    Retrieve completed katas from Codewars.
+    Turn solution items into new katas.
+    
+    Each kata is marked as pushed before being yielded. No further item is
+    requested once the limit or the cursor's stop point is reached.
     
     Args:
-        push_step: Number of katas to retrieve before stopping
+        items: Items with name, level, language and code, newest first
+        limit: Number of katas to yield before stopping, None for the whole history
+        cursor: Incremental scraping cursor (optional)
+        
+    Yields:
+        Kata: Each newly extracted kata
+    """
+    if limit is not None and limit <= 0:
+        return
+        
+    count = 0
+    for item in items:
+        if cursor and cursor.should_stop(item):
+            return
+            
+        kata = extract_kata_from_item(item)
+        if kata:
+            app_state.add_completed_kata(kata.name, kata.language)
+            app_state.add_pushed_kata(kata.name, kata.language)
+            count += 1
+            yield kata
+            if limit is not None and count >= limit:
+                return
+    
+    if cursor:
+        cursor.exhausted = True
+
+def create_http_session(web_driver, pool_size: int = 4) -> requests.Session:
+    """
+    Create an HTTP session authenticated with the browser's cookies.
+    
+    The session keeps connections alive in a pool and retries transient
+    server errors with backoff.
+    
+    Args:
+        web_driver: Authenticated Selenium WebDriver instance
+        pool_size: Maximum number of pooled connections per host
         
     Returns:
-        List[Kata]: List of retrieved katas
-    """
-    katas = []
-    while len(katas) < push_step:
-        solutions = app_state.web_driver.find_elements(By.CLASS_NAME, "list-item-solutions")
-        
-        for solution in solutions:
-            if len(katas) >= push_step:
-                break
-                
-            kata = extract_kata_from_solution(solution)
-            if kata:
-                katas.append(kata)
-                app_state.add_completed_kata(kata.name)
-                app_state.add_pushed_kata(kata.name)
-        
-        if not load_more_solutions():
-            break
+        requests.Session: Session sending the browser's cookies and user agent
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = web_driver.execute_script("return navigator.userAgent")
+    for cookie in web_driver.get_cookies():
+        session.cookies.set(
+            cookie['name'],
+            cookie['value'],
+            domain=cookie.get('domain', ''),
+            path=cookie.get('path', '/')
+        )
+    return session
+
+def parse_solution_items(html: str) -> Tuple[List[Dict[str, Optional[str]]], Optional[str]]:
+    """
+    Parse a completed solutions page, or a fragment loaded by its infinite scroll.
+    
+    Args:
+        html: Page or fragment content
+        
+    Returns:
+        Tuple[List[Dict], Optional[str]]: Items with name, level, language and code,
+        and the URL of the next fragment (None if this is the last one)
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    items = []
+    for element in soup.select('.list-item-solutions'):
+        title = element.select_one('.item-title')
+        link = title.find('a') if title else None
+        level = title.find('span') if title else None
+        code = element.select_one('.markdown code')
+        completed = element.select_one('time-ago[datetime], time[datetime]')
+        items.append({
+            'name': link.get_text().strip() if link else None,
+            'level': level.get_text().strip() if level else None,
+            'language': (code.get('data-language') or '').lower() if code else None,
+            'code': code.get_text() if code else None,
+            'completed_at': completed.get('datetime') if completed else None
+        })
+    
+    marker = soup.select_one('.js-infinite-marker')
+    next_url = None
+    if marker:
+        next_url = next((marker[name] for name in MARKER_URL_ATTRIBUTES if marker.get(name)), None)
+    return items, next_url
+
+def iter_http_solution_batches(session: requests.Session, url: str,
+                               timeout: float = 10) -> Iterator[List[Dict[str, Optional[str]]]]:
+    """
+    Yield the solutions of the completed solutions page, one batch per fragment.
+    
+    The first page is followed by the fragments its infinite scroll would
+    load, requested directly over HTTP.
+    
+    Args:
+        session: Authenticated HTTP session
+        url: URL of the completed solutions page
+        timeout: Maximum wait for each response, in seconds
+        
+    Yields:
+        List[Dict]: Items with name, level, language and code
+        
+    Raises:
+        AuthenticationError: If the session is redirected to the sign in page
+        requests.RequestException: If a page cannot be fetched
+    """
+    visited: Set[str] = set()
+    latencies: List[float] = []
+    page = 0
+    headers = {'Accept': 'text/html'}
+    try:
+        while url and url not in visited:
+            visited.add(url)
+            start = time.perf_counter()
+            response = session.get(url, headers=headers, timeout=timeout)
+            latencies.append(time.perf_counter() - start)
+            metrics.observe('http_page', latencies[-1])
+            response.raise_for_status()
+            if "sign_in" in response.url:
+                raise AuthenticationError("The HTTP session is not authenticated")
+            
+            items, next_url = parse_solution_items(response.text)
+            metrics.increment('solutions_extracted', len(items))
+            logger.debug(f"Page {page}: {len(items)} item(s) in {latencies[-1] * 1000:.0f} ms")
+            if not items:
+                return
+            yield items
             
-    return katas
\ No newline at end of file
+            # Later pages are requested like the infinite scroll does, as fragments
+            page += 1
+            headers = {'Accept': 'text/html', 'X-Requested-With': 'XMLHttpRequest'}
+            url = urljoin(response.url, next_url) if next_url else None
+    finally:
+        if latencies:
+            logger.info(
+                f"Fetched {len(latencies)} page(s) over HTTP in {sum(latencies):.2f}s "
+                f"(avg {sum(latencies) / len(latencies) * 1000:.0f} ms/page)"
+            )
@@ -1,9 +1,10 @@
 import os
+import json
 import platform
 import logging
 import subprocess
 import shutil
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from .exceptions import ChromeDriverError
 from .version import ChromeVersion
 from .system_utils import verify_npm_installation, verify_pnpm_installation, verify_yarn_installation
@@ -11,7 +12,15 @@ from .system_utils import verify_npm_installation, verify_pnpm_installation, ver
 logger = logging.getLogger(__name__)
 
 class ChromeDriverManager:
-    """Manages ChromeDriver verification."""
+    """
+    Manages ChromeDriver verification.
+    
+    The verified ChromeDriver/Chrome version pair is cached along with the
+    modification time and size of both binaries, so later starts trust it
+    without running any process until one of them changes.
+    """
+    
+    CACHE_FILE = ".chromedriver-cache.json"
     
     def __init__(self, install_path: Optional[str] = None):
         """Initialize ChromeDriver manager."""
@@ -19,6 +28,7 @@ class ChromeDriverManager:
         self.system = platform.system().lower()
         self.executable = "chromedriver.exe" if self.system == "windows" else "chromedriver"
         self.driver_path = os.path.join(self.install_path, self.executable)
+        self.cache_path = os.path.join(self.install_path, self.CACHE_FILE)
     
     def _get_package_manager_command(self) -> Tuple[str, str]:
         """
@@ -39,8 +49,16 @@ class ChromeDriverManager:
         else:
             raise ChromeDriverError("No supported Node.js package manager (pnpm, yarn, or npm) found")
     
-    def verify_driver(self) -> None:
-        """Verify ChromeDriver exists and is executable."""
+    def verify_driver(self) -> str:
+        """
+        Verify ChromeDriver exists and is executable.
+        
+        Returns:
+            str: Version of ChromeDriver
+            
+        Raises:
+            ChromeDriverError: If ChromeDriver is missing or cannot be run
+        """
         if not os.path.exists(self.driver_path):
             raise ChromeDriverError(f"ChromeDriver not found at {self.driver_path}")
             
@@ -51,18 +69,100 @@ class ChromeDriverManager:
         try:
             result = subprocess.run([self.driver_path, "--version"], capture_output=True, text=True)
             version = result.stdout.split()[1]
-            logging.info(f"ChromeDriver version: {version}")
-        except (subprocess.SubprocessError, IndexError) as e:
+            logger.info(f"ChromeDriver version: {version}")
+            return version
+        except (subprocess.SubprocessError, OSError, IndexError) as e:
             raise ChromeDriverError(f"Failed to get ChromeDriver version: {e}") 
+    
+    def _chrome_identity(self, chrome_path: Optional[str]) -> Union[List[int], str, None]:
+        """Identify the installed Chrome without running it: its file stat, or its registry version on Windows."""
+        if chrome_path:
+            return self._file_identity(chrome_path)
+        if self.system == "windows":
+            try:
+                return ChromeVersion.get_chrome_version()
+            except ChromeDriverError:
+                return None
+        return None
+    
+    @staticmethod
+    def _file_identity(path: str) -> Optional[List[int]]:
+        """Get the (mtime_ns, size) of a file, None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the cached verification, empty if missing or unreadable."""
+        try:
+            with open(self.cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self, driver_version: str, chrome_path: Optional[str], chrome_version: Optional[str]) -> None:
+        """Cache a verified ChromeDriver/Chrome pair with the identity of both binaries."""
+        cache = {
+            "driver": self._file_identity(self.driver_path),
+            "driver_version": driver_version,
+            "chrome_path": chrome_path,
+            "chrome": self._chrome_identity(chrome_path),
+            "chrome_version": chrome_version
+        }
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache ChromeDriver verification: {e}")
+    
+    def _is_cache_valid(self, cache: Dict[str, Any], chrome_path: Optional[str]) -> bool:
+        """Check whether neither binary changed since the cached verification."""
+        return (
+            bool(cache.get("driver_version"))
+            and cache.get("driver") == self._file_identity(self.driver_path)
+            and cache.get("chrome_path") == chrome_path
+            and cache.get("chrome") == self._chrome_identity(chrome_path)
+        )
 
     def update_if_needed(self) -> None:
-        """Update ChromeDriver if needed."""
+        """
+        Update ChromeDriver if it is missing, broken or does not match Chrome.
+        
+        Raises:
+            ChromeDriverError: If ChromeDriver cannot be verified or downloaded
+        """
+        chrome_path = ChromeVersion.find_chrome_executable()
+        cache = self._load_cache()
+        if self._is_cache_valid(cache, chrome_path):
+            logger.info(
+                f"ChromeDriver {cache['driver_version']} verified for Chrome "
+                f"{cache.get('chrome_version') or 'unknown'} (cached)"
+            )
+            return
+            
         try:
-            self.verify_driver()
+            driver_version = self.verify_driver()
         except ChromeDriverError:
             logger.info("ChromeDriver needs to be updated")
             self._download_driver()
-            self.verify_driver()
+            driver_version = self.verify_driver()
+            
+        try:
+            chrome_version = ChromeVersion.get_chrome_version()
+        except ChromeDriverError as e:
+            logger.warning(f"Could not check ChromeDriver compatibility: {e}")
+            chrome_version = None
+            
+        if chrome_version and not ChromeVersion.is_compatible(chrome_version, driver_version):
+            logger.info(f"ChromeDriver {driver_version} does not match Chrome {chrome_version}, updating")
+            self._download_driver()
+            driver_version = self.verify_driver()
+            
+        self._save_cache(driver_version, chrome_path, chrome_version)
 
     def _download_driver(self) -> None:
         """Download ChromeDriver using available package manager."""
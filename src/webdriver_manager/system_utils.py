@@ -1,4 +1,4 @@
-import subprocess
+import shutil
 import logging
 from typing import Optional
 
@@ -6,7 +6,7 @@ logger = logging.getLogger(__name__)
 
 def check_command_exists(command: str) -> bool:
     """
-    Check if a command exists in the system PATH.
+    Check if a command exists in the system PATH, without running it.
     
     Args:
         command: The command to check
@@ -14,14 +14,7 @@ def check_command_exists(command: str) -> bool:
     Returns:
         bool: True if command exists, False otherwise
     """
-    try:
-        subprocess.run([command, '--version'], 
-                     stdout=subprocess.PIPE, 
-                     stderr=subprocess.PIPE, 
-                     check=True)
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+    return shutil.which(command) is not None
 def verify_pnpm_installation() -> bool:
     """
     Verify if pnpm is installed on the system.
@@ -1,4 +1,6 @@
+import os
 import re
+import shutil
 import subprocess
 import platform
 from typing import Optional
@@ -8,6 +10,26 @@ class ChromeVersion:
     """Handles Chrome version detection and comparison."""
     
     VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+    LINUX_EXECUTABLES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser']
+    MACOS_EXECUTABLE = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+    
+    @staticmethod
+    def find_chrome_executable() -> Optional[str]:
+        """
+        Find the Chrome executable without running it.
+        
+        Returns:
+            Optional[str]: Resolved path of the executable, None if unknown (e.g. on Windows)
+        """
+        system = platform.system().lower()
+        if system == "linux":
+            for executable in ChromeVersion.LINUX_EXECUTABLES:
+                path = shutil.which(executable)
+                if path:
+                    return os.path.realpath(path)
+        elif system == "darwin" and os.path.exists(ChromeVersion.MACOS_EXECUTABLE):
+            return ChromeVersion.MACOS_EXECUTABLE
+        return None
     
     @staticmethod
     def get_chrome_version() -> str:
@@ -15,30 +37,24 @@ class ChromeVersion:
         system = platform.system().lower()
         
         if system == "linux":
-            chrome_executables = [
-                'google-chrome',
-                'google-chrome-stable',
-                'chromium',
-                'chromium-browser'
-            ]
-            
-            for executable in chrome_executables:
-                try:
-                    version = subprocess.check_output([executable, '--version'], 
-                                                    stderr=subprocess.DEVNULL)
-                    version = version.decode('utf-8')
-                    match = re.search(ChromeVersion.VERSION_PATTERN, version)
-                    if match:
-                        return match.group(0)
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    continue
-                    
-            raise VersionError("Failed to detect Chrome version: Chrome not found")
+            executable = ChromeVersion.find_chrome_executable()
+            if not executable:
+                raise VersionError("Failed to detect Chrome version: Chrome not found")
+                
+            try:
+                version = subprocess.check_output([executable, '--version'], 
+                                                stderr=subprocess.DEVNULL)
+                match = re.search(ChromeVersion.VERSION_PATTERN, version.decode('utf-8'))
+                if match:
+                    return match.group(0)
+            except (subprocess.CalledProcessError, OSError) as e:
+                raise VersionError(f"Failed to detect Chrome version: {str(e)}")
+            raise VersionError("Invalid Chrome version format")
             
         elif system == "darwin":
             try:
                 process = subprocess.Popen(
-                    ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version'],
+                    [ChromeVersion.MACOS_EXECUTABLE, '--version'],
                     stdout=subprocess.PIPE, stderr=subprocess.PIPE
                 )
                 version = process.communicate()[0].decode('UTF-8')
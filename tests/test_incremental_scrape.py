@@ -0,0 +1,59 @@
+"""Check that incremental scrapes never skip new katas."""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import web_scraper
+from gvars import ApplicationState
+from web_scraper import ScrapeCursor, iter_katas
+
+def listing(count: int) -> list:
+    """Build a solutions listing of `count` katas, newest first."""
+    return [
+        {'name': f"Kata {number}", 'level': "6 kyu", 'language': "python", 'code': "pass"}
+        for number in range(count, 0, -1)
+    ]
+
+class BacklogLargerThanPushStepTest(unittest.TestCase):
+    """New katas above an already exported run must all be exported."""
+
+    def setUp(self):
+        patcher = mock.patch.object(web_scraper, 'app_state', ApplicationState())
+        self.app_state = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.high_water_mark = None
+
+    def export(self, items: list, push_step=None, stop_after: int = 20) -> list:
+        """Run an incremental export like main.export, moving the mark after a complete scrape."""
+        cursor = ScrapeCursor(stop_marker=self.high_water_mark, stop_after=stop_after)
+        names = [kata.name for kata in iter_katas(iter(items), push_step, cursor)]
+        if cursor.exhausted and cursor.newest_seen:
+            self.high_water_mark = cursor.newest_seen
+        return names
+
+    def test_every_new_kata_is_exported(self):
+        self.assertEqual(len(self.export(listing(100))), 100)
+        self.assertEqual(self.high_water_mark, ("Kata 100", "python"))
+
+        # 30 new katas exported 5 at a time
+        for _ in range(8):
+            self.export(listing(130), push_step=5)
+
+        missing = [number for number in range(1, 131) if not self.app_state.is_kata_pushed(f"Kata {number}", "python")]
+        self.assertEqual(missing, [])
+        self.assertEqual(self.high_water_mark, ("Kata 130", "python"))
+
+    def test_run_of_exported_katas_does_not_record_a_mark(self):
+        for number in range(1, 51):
+            self.app_state.add_pushed_kata(f"Kata {number}", "python")
+
+        # Without a mark, the scrape stops at the run of exported katas but is not complete
+        self.assertEqual(len(self.export(listing(80), stop_after=10)), 30)
+        self.assertIsNone(self.high_water_mark)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Check that every VCS backend commits only the files it is given."""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from vcs import get_backend
+
+def git(repo_path: str, *args: str) -> str:
+    """Run a git command in a repository and return its output."""
+    return subprocess.run(['git', *args], cwd=repo_path, capture_output=True, text=True, check=True).stdout
+
+class CommitOnlyGivenPathsTest(unittest.TestCase):
+    """Files staged by the user must stay out of the kata commits."""
+
+    def setUp(self):
+        self.repo_path = tempfile.mkdtemp(prefix="ktas-vcs-")
+        git(self.repo_path, 'init', '-q')
+        git(self.repo_path, 'config', 'user.name', 'test')
+        git(self.repo_path, 'config', 'user.email', 'test@example.com')
+
+    def tearDown(self):
+        shutil.rmtree(self.repo_path)
+
+    def write(self, path: str, content: str) -> None:
+        with open(os.path.join(self.repo_path, path), 'a') as f:
+            f.write(content)
+
+    def check_backend(self, name: str) -> None:
+        backend = get_backend(name)
+        try:
+            self.write('staged.txt', 'staged by the user\n')
+            git(self.repo_path, 'add', 'staged.txt')
+
+            # First commit of the repository, then one on top of it
+            self.write('katas.md', '# First kata\n')
+            backend.commit(self.repo_path, ['katas.md'], "Add first kata")
+            self.write('katas.md', '# Second kata\n')
+            backend.commit(self.repo_path, ['katas.md'], "Add second kata")
+        finally:
+            if hasattr(backend, 'close'):
+                backend.close()
+
+        self.assertEqual(git(self.repo_path, 'ls-tree', '--name-only', 'HEAD').split(), ['katas.md'])
+        self.assertEqual(git(self.repo_path, 'show', 'HEAD:katas.md'), '# First kata\n# Second kata\n')
+        self.assertEqual(git(self.repo_path, 'diff', '--cached', '--name-only').split(), ['staged.txt'])
+
+    def test_subprocess_backend(self):
+        self.check_backend('subprocess')
+
+    def test_dulwich_backend(self):
+        try:
+            import dulwich  # noqa: F401
+        except ImportError:
+            self.skipTest("dulwich is not installed")
+        self.check_backend('dulwich')
+
+if __name__ == "__main__":
+    unittest.main()